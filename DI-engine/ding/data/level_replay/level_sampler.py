@@ -1,11 +1,19 @@
 from typing import Optional, Union, Any, List
 from easydict import EasyDict
 from ding.utils import deep_merge_dicts, SequenceType
+from ding.utils.segment_tree import njit
 from collections import namedtuple
 import numpy as np
 import torch
 
 
+@njit()
+def _one_step_td_error_score(rewards: np.ndarray, value: np.ndarray) -> float:
+    max_t = len(rewards)
+    td_errors = np.abs(rewards[:max_t - 1] + value[:max_t - 1] - value[1:max_t])
+    return td_errors.mean()
+
+
 class LevelSampler():
     """
     Overview:
@@ -33,7 +41,7 @@ class LevelSampler():
 
     def __init__(
         self,
-        seeds: Optional[List[int]],
+        seeds: Union[List[int], np.ndarray],
         obs_space: Union[int, SequenceType],
         action_space: int,
         num_actors: int,
@@ -60,8 +68,8 @@ class LevelSampler():
         self.staleness_temperature = self.cfg.staleness_temperature
 
         # Track seeds and scores as in np arrays backed by shared memory
-        self.seeds = np.array(seeds, dtype=np.int64)
-        self.seed2index = {seed: i for i, seed in enumerate(seeds)}
+        self.seeds = np.asarray(seeds, dtype=np.int64)  # zero-copy if already int64 ndarray
+        self.seed2index = {seed: i for i, seed in enumerate(self.seeds.tolist())}
 
         self.unseen_seed_weights = np.ones(len(seeds))
         self.seed_scores = np.zeros(len(seeds))
@@ -71,6 +79,11 @@ class LevelSampler():
 
         self.next_seed_index = 0  # Only used for sequential strategy
 
+        if self.strategy == 'one_step_td_error':
+            # Trigger JIT compilation of the scoring kernel once at construction, so the
+            # first sampler update does not pay the compile cost.
+            _one_step_td_error_score(np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.float32))
+
     def update_with_rollouts(self, train_data: dict, num_actors: int):
         total_steps = train_data['reward'].shape[0]
         if self.strategy == 'random':
@@ -156,13 +169,10 @@ class LevelSampler():
         return advantages.abs().mean().item()
 
     def _one_step_td_error(self, **kwargs):
-        rewards = kwargs['rewards']
-        value = kwargs['value']
-
-        max_t = len(rewards)
-        td_errors = (rewards[:-1] + value[:max_t - 1] - value[1:max_t]).abs()
+        rewards = np.ascontiguousarray(kwargs['rewards'].numpy())
+        value = np.ascontiguousarray(kwargs['value'].numpy())
 
-        return td_errors.abs().mean().item()
+        return float(_one_step_td_error_score(rewards, value))
 
     def _update_with_rollouts(self, train_data: dict, num_actors: int, all_total_steps: int, score_function):
         level_seeds = train_data['seed'].reshape(num_actors, int(all_total_steps / num_actors)).transpose(0, 1)
@@ -171,6 +181,12 @@ class LevelSampler():
         total_steps, num_actors = policy_logits.shape[:2]
         num_decisions = len(policy_logits)
 
+        # Reshape the score inputs once instead of once per finished episode.
+        if self.strategy in ['gae', 'value_l1', 'one_step_td_error']:
+            rewards = train_data['reward'].reshape(num_actors, int(all_total_steps / num_actors)).transpose(0, 1)
+            adv = train_data['adv'].reshape(num_actors, int(all_total_steps / num_actors)).transpose(0, 1)
+            value = train_data['value'].reshape(num_actors, int(all_total_steps / num_actors)).transpose(0, 1)
+
         for actor_index in range(num_actors):
             done_steps = done[:, actor_index].nonzero()[:total_steps, 0]
             start_t = 0
@@ -190,10 +206,6 @@ class LevelSampler():
                 score_function_kwargs['episode_logits'] = torch.log_softmax(episode_logits, -1)
 
                 if self.strategy in ['gae', 'value_l1', 'one_step_td_error']:
-                    rewards = train_data['reward'].reshape(num_actors,
-                                                           int(all_total_steps / num_actors)).transpose(0, 1)
-                    adv = train_data['adv'].reshape(num_actors, int(all_total_steps / num_actors)).transpose(0, 1)
-                    value = train_data['value'].reshape(num_actors, int(all_total_steps / num_actors)).transpose(0, 1)
                     score_function_kwargs['adv'] = adv[start_t:t, actor_index]
                     score_function_kwargs['rewards'] = rewards[start_t:t, actor_index]
                     score_function_kwargs['value'] = value[start_t:t, actor_index]
@@ -213,10 +225,6 @@ class LevelSampler():
                 score_function_kwargs['episode_logits'] = torch.log_softmax(episode_logits, -1)
 
                 if self.strategy in ['gae', 'value_l1', 'one_step_td_error']:
-                    rewards = train_data['reward'].reshape(num_actors,
-                                                           int(all_total_steps / num_actors)).transpose(0, 1)
-                    adv = train_data['adv'].reshape(num_actors, int(all_total_steps / num_actors)).transpose(0, 1)
-                    value = train_data['value'].reshape(num_actors, int(all_total_steps / num_actors)).transpose(0, 1)
                     score_function_kwargs['adv'] = adv[start_t:, actor_index]
                     score_function_kwargs['rewards'] = rewards[start_t:, actor_index]
                     score_function_kwargs['value'] = value[start_t:, actor_index]
@@ -230,6 +238,11 @@ class LevelSampler():
             self.seed_staleness += 1
             self.seed_staleness[selected_idx] = 0
 
+    def _update_staleness_batch(self, selected_idx: np.ndarray):
+        if self.staleness_coef > 0:
+            self.seed_staleness += len(selected_idx)
+            self.seed_staleness[selected_idx] = 0
+
     def _sample_replay_level(self):
         sample_weights = self._sample_weights()
 
@@ -285,6 +298,58 @@ class LevelSampler():
             else:
                 return self._sample_unseen_level()
 
+    def sample_batch(self, n: int, strategy: Optional[str] = None) -> np.ndarray:
+        # Batched version of ``sample``, which draws ``n`` seeds with a single vectorized
+        # ``np.random.choice`` call instead of ``n`` Python-level samples.
+        if not strategy:
+            strategy = self.strategy
+
+        if strategy == 'random':
+            return np.random.choice(self.seeds, size=n)
+
+        elif strategy == 'sequential':
+            seed_idx = (self.next_seed_index + np.arange(n)) % len(self.seeds)
+            self.next_seed_index = (self.next_seed_index + n) % len(self.seeds)
+            return self.seeds[seed_idx]
+
+        num_unseen = (self.unseen_seed_weights > 0).sum()
+        proportion_seen = (len(self.seeds) - num_unseen) / len(self.seeds)
+
+        # Decide replay vs unseen for the whole batch at once.
+        if self.replay_schedule == 'fixed':
+            if proportion_seen >= self.rho:
+                replay_mask = np.logical_or(np.random.rand(n) > self.nu, not proportion_seen < 1.0)
+            else:
+                replay_mask = np.zeros(n, dtype=bool)
+        else:  # Default to proportionate schedule
+            if proportion_seen >= self.rho:
+                replay_mask = np.random.rand(n) < proportion_seen
+            else:
+                replay_mask = np.zeros(n, dtype=bool)
+
+        sampled_seeds = np.empty(n, dtype=np.int64)
+        num_replay = int(replay_mask.sum())
+        if num_replay > 0:
+            sample_weights = self._sample_weights()
+            if np.isclose(np.sum(sample_weights), 0):
+                sample_weights = np.ones_like(sample_weights) / len(sample_weights)
+            seed_idx = np.random.choice(len(self.seeds), num_replay, p=sample_weights)
+            sampled_seeds[replay_mask] = self.seeds[seed_idx]
+            self._update_staleness_batch(seed_idx)
+        if num_replay < n:
+            sample_weights = self.unseen_seed_weights / self.unseen_seed_weights.sum()
+            seed_idx = np.random.choice(len(self.seeds), n - num_replay, p=sample_weights)
+            sampled_seeds[~replay_mask] = self.seeds[seed_idx]
+            self._update_staleness_batch(seed_idx)
+
+        return sampled_seeds
+
+    def sample_batch_into(self, out: np.ndarray, strategy: Optional[str] = None) -> np.ndarray:
+        # Fill a caller-owned int64 buffer, so the hot loop can reuse one preallocated
+        # array instead of receiving a fresh one per call.
+        np.copyto(out, self.sample_batch(out.shape[0], strategy))
+        return out
+
     def _sample_weights(self):
         weights = self._score_transform(self.score_transform, self.temperature, self.seed_scores)
         weights = weights * (1 - self.unseen_seed_weights)  # zero out unseen levels
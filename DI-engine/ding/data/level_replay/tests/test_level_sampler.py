@@ -36,3 +36,6 @@ def test_level_sampler():
     level_sampler.update_with_rollouts(train_data, collector_env_num)
     sample_seed = level_sampler.sample()
     assert isinstance(sample_seed, int)
+    sample_seeds = level_sampler.sample_batch(collector_env_num)
+    assert isinstance(sample_seeds, np.ndarray)
+    assert sample_seeds.shape == (collector_env_num, )
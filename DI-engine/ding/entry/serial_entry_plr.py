@@ -1,125 +1,284 @@
-from typing import Union, Optional, List, Any, Tuple
-import os
-import torch
-import logging
-from functools import partial
-from tensorboardX import SummaryWriter
-from copy import deepcopy
-
-from ding.envs import get_vec_env_setting, create_env_manager
-from ding.worker import BaseLearner, InteractionSerialEvaluator, BaseSerialCommander, create_buffer, \
-    create_serial_collector
-from ding.config import read_config, compile_config
-from ding.policy import create_policy, PolicyFactory
-from ding.reward_model import create_reward_model
-from ding.utils import set_pkg_seed
-from ding.data.level_replay.level_sampler import LevelSampler
-from ding.policy.common_utils import default_preprocess_learn
-
-
-def generate_seeds(num_seeds=500, base_seed=0):
-    return [base_seed + i for i in range(num_seeds)]
-
-
-def serial_pipeline_plr(
-        input_cfg: Union[str, Tuple[dict, dict]],
-        seed: int = 0,
-        env_setting: Optional[List[Any]] = None,
-        model: Optional[torch.nn.Module] = None,
-        max_train_iter: Optional[int] = int(1e10),
-        max_env_step: Optional[int] = int(1e10),
-) -> 'Policy':  # noqa
-    """
-    Overview:
-        Serial pipeline entry for Priority Level Replay.
-    Arguments:
-        - input_cfg (:obj:`Union[str, Tuple[dict, dict]]`): Config in dict type. \
-            ``str`` type means config file path. \
-            ``Tuple[dict, dict]`` type means [user_config, create_cfg].
-        - seed (:obj:`int`): Random seed.
-        - env_setting (:obj:`Optional[List[Any]]`): A list with 3 elements: \
-            ``BaseEnv`` subclass, collector env config, and evaluator env config.
-        - model (:obj:`Optional[torch.nn.Module]`): Instance of torch.nn.Module.
-        - max_train_iter (:obj:`Optional[int]`): Maximum policy update iterations in training.
-        - max_env_step (:obj:`Optional[int]`): Maximum collected environment interaction steps.
-    Returns:
-        - policy (:obj:`Policy`): Converged policy.
-    """
-    if isinstance(input_cfg, str):
-        cfg, create_cfg = read_config(input_cfg)
-    else:
-        cfg, create_cfg = deepcopy(input_cfg)
-    create_cfg.policy.type = create_cfg.policy.type + '_command'
-    env_fn = None if env_setting is None else env_setting[0]
-    cfg = compile_config(cfg, seed=seed, env=env_fn, auto=True, create_cfg=create_cfg, save_cfg=True)
-    collector_env_num = cfg.env.collector_env_num
-    # Create main components: env, policy
-    if env_setting is None:
-        env_fn, collector_env_cfg, evaluator_env_cfg = get_vec_env_setting(cfg.env)
-    else:
-        env_fn, collector_env_cfg, evaluator_env_cfg = env_setting
-    collector_env = create_env_manager(cfg.env.manager, [partial(env_fn, cfg=c) for c in collector_env_cfg])
-    evaluator_env = create_env_manager(cfg.env.manager, [partial(env_fn, cfg=c) for c in evaluator_env_cfg])
-    collector_env.seed(cfg.seed, dynamic_seed=False)
-    evaluator_env.seed(cfg.seed, dynamic_seed=True)
-    train_seeds = generate_seeds()
-    level_sampler = LevelSampler(
-        train_seeds, cfg.policy.model.obs_shape, cfg.policy.model.action_shape, collector_env_num, cfg.level_replay
-    )
-    set_pkg_seed(cfg.seed, use_cuda=cfg.policy.cuda)
-    policy = create_policy(cfg.policy, model=model, enable_field=['learn', 'collect', 'eval', 'command'])
-
-    # Create worker components: learner, collector, evaluator, replay buffer, commander.
-    tb_logger = SummaryWriter(os.path.join('./{}/log/'.format(cfg.exp_name), 'serial'))
-    learner = BaseLearner(cfg.policy.learn.learner, policy.learn_mode, tb_logger, exp_name=cfg.exp_name)
-    collector = create_serial_collector(
-        cfg.policy.collect.collector,
-        env=collector_env,
-        policy=policy.collect_mode,
-        tb_logger=tb_logger,
-        exp_name=cfg.exp_name
-    )
-    evaluator = InteractionSerialEvaluator(
-        cfg.policy.eval.evaluator, evaluator_env, policy.collect_mode, tb_logger, exp_name=cfg.exp_name
-    )
-    commander = BaseSerialCommander(
-        cfg.policy.other.commander, learner, collector, evaluator, None, policy.command_mode
-    )
-
-    # ==========
-    # Main loop
-    # ==========
-    # Learner's before_run hook.
-    learner.call_hook('before_run')
-
-    seeds = [int(level_sampler.sample('sequential')) for _ in range(collector_env_num)]
-    # default_preprocess_learn function can only deal with the Tensor data
-    level_seeds = torch.Tensor(seeds)
-
-    collector_env.seed(seeds)
-    collector_env.reset()
-
-    while True:
-        collect_kwargs = commander.step()
-        # Evaluate policy performance
-        if evaluator.should_eval(learner.train_iter):
-            stop, reward = evaluator.eval(learner.save_checkpoint, learner.train_iter, collector.envstep)
-            if stop:
-                break
-        # Collect data by default config n_sample/n_episode
-        new_data = collector.collect(
-            train_iter=learner.train_iter, level_seeds=level_seeds, policy_kwargs=collect_kwargs
-        )
-        # Learn policy from collected data
-        learner.train(new_data, collector.envstep)
-        stacked_data = default_preprocess_learn(new_data, ignore_done=cfg.policy.learn.ignore_done, use_nstep=False)
-        level_sampler.update_with_rollouts(stacked_data, collector_env_num)
-        seeds = [int(level_sampler.sample()) for _ in range(collector_env_num)]
-        level_seeds = torch.Tensor(seeds)
-        collector_env.seed(seeds)
-        collector_env.reset()
-        if collector.envstep >= max_env_step or learner.train_iter >= max_train_iter:
-            break
-    # Learner's after_run hook.
-    learner.call_hook('after_run')
-    return policy
+from typing import Union, Optional, List, Any, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+from functools import partial
+from tensorboardX import SummaryWriter
+from copy import copy, deepcopy
+from easydict import EasyDict
+
+from ding.envs import get_vec_env_setting, create_env_manager
+from ding.worker import BaseLearner, InteractionSerialEvaluator, BaseSerialCommander, create_buffer, \
+    create_serial_collector
+from ding.config import read_config, compile_config
+from ding.policy import create_policy, PolicyFactory
+from ding.reward_model import create_reward_model
+from ding.utils import set_pkg_seed, AsyncSummaryWriter
+from ding.data.level_replay.level_sampler import LevelSampler
+from ding.utils.data import default_collate
+
+
+def generate_seeds(num_seeds=500, base_seed=0):
+    return np.arange(base_seed, base_seed + num_seeds, dtype=np.int64)
+
+
+def _async_eval_worker(cfg: 'EasyDict', env_setting: Optional[List[Any]], ckpt_queue, result_queue) -> None:  # noqa
+    """
+    Overview:
+        Background evaluator process for ``serial_pipeline_plr``. It owns an independent
+        evaluator env and policy copy, loads every checkpoint pushed by the training loop
+        through ``ckpt_queue`` and reports ``(stop, reward)`` back via ``result_queue``.
+    """
+    if env_setting is None:
+        env_fn, _, evaluator_env_cfg = get_vec_env_setting(cfg.env)
+    else:
+        env_fn, _, evaluator_env_cfg = env_setting
+    # The worker is already its own process, so the base manager is enough here and
+    # avoids nesting subprocesses.
+    evaluator_env = create_env_manager(EasyDict(type='base'), [partial(env_fn, cfg=c) for c in evaluator_env_cfg])
+    evaluator_env.seed(cfg.seed, dynamic_seed=True)
+    set_pkg_seed(cfg.seed, use_cuda=cfg.policy.cuda)
+    policy = create_policy(cfg.policy, enable_field=['collect'])
+    tb_logger = SummaryWriter(os.path.join('./{}/log/'.format(cfg.exp_name), 'async_evaluator'))
+    evaluator = InteractionSerialEvaluator(
+        cfg.policy.eval.evaluator,
+        evaluator_env,
+        policy.collect_mode,
+        tb_logger,
+        exp_name=cfg.exp_name,
+        instance_name='async_evaluator'
+    )
+    while True:
+        task = ckpt_queue.get()
+        if task is None:
+            break
+        train_iter, envstep, ckpt_path = task
+        policy.collect_mode.load_state_dict(torch.load(ckpt_path, map_location='cpu'))
+        stop, reward = evaluator.eval(None, train_iter, envstep)
+        result_queue.put((stop, reward))
+    evaluator_env.close()
+
+
+def serial_pipeline_plr(
+        input_cfg: Union[str, Tuple[dict, dict]],
+        seed: int = 0,
+        env_setting: Optional[List[Any]] = None,
+        model: Optional[torch.nn.Module] = None,
+        max_train_iter: Optional[int] = int(1e10),
+        max_env_step: Optional[int] = int(1e10),
+) -> 'Policy':  # noqa
+    """
+    Overview:
+        Serial pipeline entry for Priority Level Replay.
+    Arguments:
+        - input_cfg (:obj:`Union[str, Tuple[dict, dict]]`): Config in dict type. \
+            ``str`` type means config file path. \
+            ``Tuple[dict, dict]`` type means [user_config, create_cfg].
+        - seed (:obj:`int`): Random seed.
+        - env_setting (:obj:`Optional[List[Any]]`): A list with 3 elements: \
+            ``BaseEnv`` subclass, collector env config, and evaluator env config.
+        - model (:obj:`Optional[torch.nn.Module]`): Instance of torch.nn.Module.
+        - max_train_iter (:obj:`Optional[int]`): Maximum policy update iterations in training.
+        - max_env_step (:obj:`Optional[int]`): Maximum collected environment interaction steps.
+    Returns:
+        - policy (:obj:`Policy`): Converged policy.
+    """
+    if isinstance(input_cfg, str):
+        cfg, create_cfg = read_config(input_cfg)
+    else:
+        # Only create_cfg.policy.type is mutated below and compile_config deep-copies
+        # its inputs anyway, so shallow-copy the mutated path instead of recursively
+        # cloning the whole nested config.
+        cfg, create_cfg = input_cfg
+        create_cfg = copy(create_cfg)
+        create_cfg.policy = copy(create_cfg.policy)
+    create_cfg.policy.type = create_cfg.policy.type + '_command'
+    env_fn = None if env_setting is None else env_setting[0]
+    cfg = compile_config(cfg, seed=seed, env=env_fn, auto=True, create_cfg=create_cfg, save_cfg=True)
+    collector_env_num = cfg.env.collector_env_num
+    # Create main components: env, policy
+    if env_setting is None:
+        env_fn, collector_env_cfg, evaluator_env_cfg = get_vec_env_setting(cfg.env)
+    else:
+        env_fn, collector_env_cfg, evaluator_env_cfg = env_setting
+    # Subprocess workers are forked exactly once here (lazy reseeding keeps them alive
+    # across iterations), fork pages are copy-on-write, and each worker already calls
+    # torch.set_num_threads(1) on startup, so env subprocess creation is a one-time
+    # cost and needs no prewarmed worker pool.
+    # Build each env factory exactly once and share the closures with every consumer
+    # below, so worker boot payloads are created from a single factory list instead of
+    # repeated partial(env_fn, cfg=c) construction.
+    collector_env_fns = [partial(env_fn, cfg=c) for c in collector_env_cfg]
+    evaluator_env_fns = [partial(env_fn, cfg=c) for c in evaluator_env_cfg]
+    if cfg.env.manager.type == 'env_pool':
+        # PLR must apply a freshly sampled seed to each env every episode, but envpool
+        # only takes one scalar base seed at launch (env i always plays seed+i) and
+        # cannot be reseeded afterwards -- the sampled levels would never actually be
+        # played while transitions were still tagged with them. Refuse the combination
+        # until envpool supports per-env reseeding.
+        raise ValueError(
+            "env manager type 'env_pool' is not supported by serial_pipeline_plr: envpool cannot "
+            "be reseeded per env after launch, which level replay requires; use 'base' or 'subprocess'"
+        )
+    collector_env = create_env_manager(cfg.env.manager, collector_env_fns)
+    # Evaluation runs few envs episodically on the training thread, so per-step
+    # subprocess IPC is a net loss there; force the sync base manager instead.
+    eval_manager_cfg = deepcopy(cfg.env.manager)
+    eval_manager_cfg.type = 'base'
+    evaluator_env = create_env_manager(eval_manager_cfg, evaluator_env_fns)
+    # The collector env is seeded once below with the first batch of PLR level seeds;
+    # seeding it here with cfg.seed would be overwritten before any env ever resets.
+    evaluator_env.seed(cfg.seed, dynamic_seed=True)
+    train_seeds = generate_seeds()
+    level_sampler = LevelSampler(
+        train_seeds, cfg.policy.model.obs_shape, cfg.policy.model.action_shape, collector_env_num, cfg.level_replay
+    )
+    set_pkg_seed(cfg.seed, use_cuda=cfg.policy.cuda)
+    # torch.compile acceleration is handled by Policy.__init__ itself when the config
+    # sets policy.compile=dict(enable=True, ...): the shared model.forward is compiled
+    # once and reused by the learn/collect/eval wrappers, which keep their wrapper API.
+    policy = create_policy(cfg.policy, model=model, enable_field=['learn', 'collect', 'eval', 'command'])
+
+    # Create worker components: learner, collector, evaluator, replay buffer, commander.
+    # The async writer moves protobuf serialization and file IO of scalar logging off
+    # the training thread.
+    tb_logger = AsyncSummaryWriter(os.path.join('./{}/log/'.format(cfg.exp_name), 'serial'))
+    learner = BaseLearner(cfg.policy.learn.learner, policy.learn_mode, tb_logger, exp_name=cfg.exp_name)
+    collector = create_serial_collector(
+        cfg.policy.collect.collector,
+        env=collector_env,
+        policy=policy.collect_mode,
+        tb_logger=tb_logger,
+        exp_name=cfg.exp_name
+    )
+    evaluator = InteractionSerialEvaluator(
+        cfg.policy.eval.evaluator, evaluator_env, policy.collect_mode, tb_logger, exp_name=cfg.exp_name
+    )
+    commander = BaseSerialCommander(
+        cfg.policy.other.commander, learner, collector, evaluator, None, policy.command_mode
+    )
+
+    # Optionally run evaluation in a background process that polls for new checkpoints,
+    # so the multi-episode eval rollout no longer stalls collection and training.
+    async_eval = cfg.policy.eval.evaluator.get('async_eval', False)
+    if async_eval:
+        mp_ctx = mp.get_context('spawn')  # spawn avoids CUDA-fork issues
+        ckpt_queue, eval_result_queue = mp_ctx.Queue(), mp_ctx.Queue()
+        eval_proc = mp_ctx.Process(
+            target=_async_eval_worker, args=(cfg, env_setting, ckpt_queue, eval_result_queue), daemon=True
+        )
+        eval_proc.start()
+
+    # ==========
+    # Main loop
+    # ==========
+    # Learner's before_run hook.
+    learner.call_hook('before_run')
+
+    # The sampler update is CPU-side scoring that only reads the finished rollout, so it
+    # can run on a background thread while the learner trains on the same data. A single
+    # worker keeps sampler updates ordered without extra locks, since ``LevelSampler``
+    # state is only read again in ``sample_batch`` after the future is waited on.
+    sampler_executor = ThreadPoolExecutor(max_workers=1)
+
+    def update_sampler(data):
+        # The learner's own GPU batch is built inside policy._forward_learn and is not
+        # exposed, so it cannot be reused here; instead of re-running the full
+        # default_preprocess_learn on the CPU copy, collate only the few
+        # low-dimensional fields the sampler reads, which keeps the image observations
+        # from being stacked (and shipped) a second time.
+        keys = ['seed', 'logit', 'done', 'reward']
+        if level_sampler.strategy in ('gae', 'value_l1', 'one_step_td_error'):
+            keys += ['adv', 'value']
+        stacked_data = {k: default_collate([t[k] for t in data]) for k in keys}
+        if cfg.policy.learn.ignore_done:
+            stacked_data['done'] = torch.zeros_like(stacked_data['done']).float()
+        else:
+            stacked_data['done'] = stacked_data['done'].float()
+        level_sampler.update_with_rollouts(stacked_data, collector_env_num)
+
+    use_cuda = cfg.policy.cuda and torch.cuda.is_available()
+    # One preallocated seed buffer is reused every iteration; only the level_seeds
+    # tensor is freshly allocated because collected transitions keep views into it.
+    seeds = np.empty(collector_env_num, dtype=np.int64)
+    level_sampler.sample_batch_into(seeds, 'sequential')
+    # Seeds are small integers, so an int32 tensor is enough; default_preprocess_learn
+    # only requires Tensor data and does not care about the dtype of the seed field.
+    level_seeds = torch.as_tensor(seeds, dtype=torch.int32)
+    if use_cuda:
+        # Pinned host memory lets any downstream .to(device) copy of the seed field run
+        # asynchronously. A fresh pinned tensor (served from torch's caching host
+        # allocator) is used per iteration because collected transitions keep views
+        # into it across iterations.
+        level_seeds = level_seeds.pin_memory()
+
+    collector_env.seed(seeds, dynamic_seed=False)
+    collector_env.reset()
+
+    # With allow_async_train, learner updates are enqueued on a side CUDA stream; the
+    # compute stream only waits on it right before the next collect forward, so env
+    # stepping (CPU-bound) overlaps with the GPU training kernels. The policy used for
+    # collection is thus at most one optimizer step behind, IMPALA-style.
+    allow_async_train = use_cuda and cfg.policy.get('allow_async_train', False)
+    train_stream = torch.cuda.Stream() if allow_async_train else None
+
+    while True:
+        collect_kwargs = commander.step()
+        if allow_async_train:
+            # eval forwards and checkpoint state_dict serialization read the parameters
+            # on the default stream; order them after the previous iteration's optimizer
+            # step still in flight on train_stream, or they may see torn updates
+            torch.cuda.current_stream().wait_stream(train_stream)
+        # Evaluate policy performance
+        stop = False
+        if async_eval:
+            while not eval_result_queue.empty():
+                stop, reward = eval_result_queue.get()
+            if not stop and evaluator.should_eval(learner.train_iter):
+                learner.save_checkpoint('ckpt_async_eval.pth.tar')
+                ckpt_path = os.path.join('./{}/ckpt'.format(cfg.exp_name), 'ckpt_async_eval.pth.tar')
+                ckpt_queue.put((learner.train_iter, collector.envstep, ckpt_path))
+        elif evaluator.should_eval(learner.train_iter):
+            stop, reward = evaluator.eval(learner.save_checkpoint, learner.train_iter, collector.envstep)
+        if stop:
+            break
+        # Collect data by default config n_sample/n_episode; the collect forward is
+        # already ordered after the pending update by the wait_stream above.
+        new_data = collector.collect(
+            train_iter=learner.train_iter, level_seeds=level_seeds, policy_kwargs=collect_kwargs
+        )
+        sampler_future = sampler_executor.submit(update_sampler, new_data)
+        # Learn policy from collected data
+        if allow_async_train:
+            with torch.cuda.stream(train_stream):
+                learner.train(new_data, collector.envstep)
+        else:
+            learner.train(new_data, collector.envstep)
+        sampler_future.result()
+        level_sampler.sample_batch_into(seeds)
+        level_seeds = torch.as_tensor(seeds, dtype=torch.int32)
+        if use_cuda:
+            level_seeds = level_seeds.pin_memory()
+        # The manager stores per-env seeds and applies each one lazily at the auto-reset
+        # triggered when that env finishes its episode, so no synchronous full reset of
+        # all (mostly mid-episode) envs is needed here. The collector keeps its own
+        # per-env record of the seed actually in effect and only switches an env's tag
+        # when it observes that env reset, so transitions of envs still playing the
+        # previous level stay attributed to the previous seed.
+        collector_env.seed(seeds, dynamic_seed=False)
+        if collector.envstep >= max_env_step or learner.train_iter >= max_train_iter:
+            break
+    sampler_executor.shutdown()
+    if allow_async_train:
+        train_stream.synchronize()
+    if async_eval:
+        ckpt_queue.put(None)
+        eval_proc.join(timeout=60)
+        if eval_proc.is_alive():
+            eval_proc.terminate()
+    # Learner's after_run hook.
+    learner.call_hook('after_run')
+    tb_logger.close()
+    return policy
@@ -1,5 +1,6 @@
 from .base_env_manager import BaseEnvManager, BaseEnvManagerV2, create_env_manager, get_env_manager_cls
 from .subprocess_env_manager import AsyncSubprocessEnvManager, SyncSubprocessEnvManager, SubprocessEnvManagerV2
 from .gym_vector_env_manager import GymVectorEnvManager
+from .bucket_env_manager import BucketEnvManager
 # Do not import PoolEnvManager, because it depends on installation of `envpool`
 from .env_supervisor import EnvSupervisor
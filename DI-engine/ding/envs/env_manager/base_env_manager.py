@@ -8,6 +8,7 @@ import platform
 import numbers
 import enum
 import time
+import numpy as np
 import treetensor.numpy as tnp
 from ding.utils import ENV_MANAGER_REGISTRY, import_module, one_time_warning, make_key_as_identifier, WatchDog, \
     remove_illegal_item
@@ -386,9 +387,12 @@ class BaseEnvManager(object):
         Overview:
             Set the seed for each environment.
         Arguments:
-            - seed (:obj:`Union[Dict[int, int], List[int], int]`): List of seeds for each environment; \
-                Or one seed for the first environment and other seeds are generated automatically.
+            - seed (:obj:`Union[Dict[int, int], List[int], int]`): List (or int ndarray) of seeds for each \
+                environment; Or one seed for the first environment and other seeds are generated automatically.
         """
+        if isinstance(seed, np.ndarray):
+            # accept an int ndarray directly so callers need not keep a parallel Python list
+            seed = seed.tolist()
         if isinstance(seed, numbers.Integral):
             seed = [seed + i for i in range(self.env_num)]
             self._env_seed = seed
@@ -0,0 +1,275 @@
+from typing import Any, Union, List, Dict, Callable, Optional
+from multiprocessing import get_context
+from collections import namedtuple
+import os
+import platform
+import time
+import traceback
+import gym
+import torch
+import numpy as np
+from easydict import EasyDict
+
+from ding.utils import ENV_MANAGER_REGISTRY
+from .base_env_manager import BaseEnvManager, EnvState
+from .subprocess_env_manager import ShmBufferContainer, CloudPickleWrapper, shm_buffer_spec
+
+
+def bucket_worker_fn(
+        parent_conn, child_conn, env_fn_wrapper, env_ids, obs_buffers, max_retry, retry_type, retry_waiting_time
+) -> None:
+    """
+    Overview:
+        Subprocess loop holding a bucket of environments. Each command covers the whole bucket
+        and is answered with a single message, so the per-step IPC cost of the parent scales
+        with the number of workers rather than the number of environments. Env exceptions are
+        caught and sent back to the parent instead of killing the worker, and resets are
+        retried up to ``max_retry`` times (recreating the env when ``retry_type`` is 'renew').
+    """
+    parent_conn.close()
+    torch.set_num_threads(1)
+    env_fns = {env_id: env_fn for env_id, env_fn in zip(env_ids, env_fn_wrapper.data)}
+    envs = {env_id: env_fn() for env_id, env_fn in env_fns.items()}
+
+    def reset_env(env_id, reset_param):
+        exc = None
+        for _ in range(max_retry):
+            try:
+                return envs[env_id].reset(**reset_param) if reset_param else envs[env_id].reset()
+            except Exception as e:
+                exc = e
+                if retry_type == 'renew':
+                    try:
+                        envs[env_id].close()
+                    except Exception:
+                        pass
+                    envs[env_id] = env_fns[env_id]()
+                time.sleep(retry_waiting_time)
+        raise exc
+
+    while True:
+        try:
+            cmd, payload = child_conn.recv()
+        except EOFError:
+            break
+        try:
+            if cmd == 'seed':
+                for env_id, (seed, dynamic_seed) in payload.items():
+                    if dynamic_seed is not None:
+                        envs[env_id].seed(seed, dynamic_seed)
+                    else:
+                        envs[env_id].seed(seed)
+                child_conn.send('done')
+            elif cmd == 'reset':
+                obs_batch = {}
+                for env_id, reset_param in payload.items():
+                    obs = reset_env(env_id, reset_param)
+                    if obs_buffers[env_id] is not None:
+                        # ship obs in place through shared memory, only the env id crosses the pipe
+                        obs_buffers[env_id].fill(obs)
+                        obs_batch[env_id] = None
+                    else:
+                        obs_batch[env_id] = obs
+                child_conn.send(obs_batch)
+            elif cmd == 'step':
+                results = {}
+                for env_id, act in payload.items():
+                    timestep = envs[env_id].step(act)
+                    if obs_buffers[env_id] is not None:
+                        obs_buffers[env_id].fill(timestep.obs)
+                        timestep = timestep._replace(obs=None)
+                    results[env_id] = timestep
+                child_conn.send(results)
+            elif cmd == 'close':
+                for env in envs.values():
+                    env.close()
+                child_conn.send('done')
+                break
+        except Exception as e:
+            # answer with the exception so the parent raises it instead of blocking on recv
+            child_conn.send(
+                e.__class__('\nEnv Process Exception:\n' + ''.join(traceback.format_tb(e.__traceback__)) + repr(e))
+            )
+    child_conn.close()
+
+
+@ENV_MANAGER_REGISTRY.register('pool')
+class BucketEnvManager(BaseEnvManager):
+    """
+    Overview:
+        Synchronous env manager that buckets ``env_num`` environments into ``num_workers``
+        subprocesses. Each worker steps its bucket sequentially and replies with one message
+        per cycle, cutting pipe send/recv calls by env_num/num_workers compared with the
+        one-process-per-env subprocess manager, and observations are transported through
+        pre-allocated shared-memory buffers instead of being pickled.
+    Interfaces:
+        seed, launch, ready_obs, step, reset, close
+    """
+
+    config = dict(
+        episode_num=float("inf"),
+        max_retry=1,
+        retry_type='reset',
+        auto_reset=True,
+        step_timeout=None,
+        reset_timeout=None,
+        retry_waiting_time=0.1,
+        # bucket specified args
+        # number of worker subprocesses, defaults to min(env_num, cpu_count)
+        num_workers=None,
+        shared_memory=True,
+        copy_on_get=True,
+        context='spawn' if platform.system().lower() == 'windows' else 'fork',
+    )
+
+    def __init__(self, env_fn: List[Callable], cfg: EasyDict = EasyDict({})) -> None:
+        super().__init__(env_fn, cfg)
+        num_workers = self._cfg.num_workers
+        if num_workers is None:
+            num_workers = os.cpu_count()
+        self._num_workers = min(num_workers, self._env_num)
+        self._shared_memory = self._cfg.shared_memory
+        self._copy_on_get = self._cfg.copy_on_get
+        self._context = self._cfg.context
+        # contiguous buckets of env ids, one per worker
+        self._buckets = [b.tolist() for b in np.array_split(np.arange(self._env_num), self._num_workers)]
+        self._env2worker = {env_id: w for w, bucket in enumerate(self._buckets) for env_id in bucket}
+
+    def _create_state(self) -> None:
+        self._env_episode_count = {i: 0 for i in range(self.env_num)}
+        self._ready_obs = {i: None for i in range(self.env_num)}
+        self._reset_param = {i: {} for i in range(self.env_num)}
+        if self._shared_memory:
+            dtype, shape = shm_buffer_spec(self._observation_space)
+            self._obs_buffers = {
+                env_id: ShmBufferContainer(dtype, shape, copy_on_get=self._copy_on_get)
+                for env_id in range(self.env_num)
+            }
+        else:
+            self._obs_buffers = {env_id: None for env_id in range(self.env_num)}
+        ctx = get_context(self._context)
+        self._pipe_parents, self._workers = [], []
+        for w, bucket in enumerate(self._buckets):
+            parent_conn, child_conn = ctx.Pipe()
+            proc = ctx.Process(
+                target=bucket_worker_fn,
+                args=(
+                    parent_conn,
+                    child_conn,
+                    CloudPickleWrapper([self._env_fn[env_id] for env_id in bucket]),
+                    bucket,
+                    {env_id: self._obs_buffers[env_id]
+                     for env_id in bucket},
+                    self._max_retry,
+                    self._retry_type,
+                    self._retry_waiting_time,
+                ),
+                daemon=True,
+                name='bucket_env_manager{}_{}'.format(w, time.time())
+            )
+            proc.start()
+            child_conn.close()
+            self._pipe_parents.append(parent_conn)
+            self._workers.append(proc)
+        self._env_states = {i: EnvState.INIT for i in range(self.env_num)}
+        self._closed = False
+
+    def _recv(self, worker_id: int, timeout: Optional[float] = None) -> Any:
+        # one reply covers a whole bucket, so the timeout bounds the sequential
+        # reset/step of every env held by the worker
+        if timeout is not None and not self._pipe_parents[worker_id].poll(timeout):
+            raise RuntimeError('bucket worker {} did not answer within {} seconds'.format(worker_id, timeout))
+        data = self._pipe_parents[worker_id].recv()
+        if isinstance(data, Exception):
+            raise data
+        return data
+
+    def _group_by_worker(self, env_ids: List[int]) -> Dict[int, List[int]]:
+        groups = {}
+        for env_id in env_ids:
+            groups.setdefault(self._env2worker[env_id], []).append(env_id)
+        return groups
+
+    def _apply_pending_seeds(self, env_ids: List[int]) -> None:
+        # forward the lazily stored per-env seeds once, as BaseEnvManager does before reset
+        pending = [i for i in env_ids if self._env_seed[i] is not None]
+        if len(pending) == 0:
+            return
+        for w, bucket in self._group_by_worker(pending).items():
+            payload = {i: (self._env_seed[i], self._env_dynamic_seed) for i in bucket}
+            self._pipe_parents[w].send(['seed', payload])
+        for w in self._group_by_worker(pending).keys():
+            self._recv(w)
+        for i in pending:
+            self._env_seed[i] = None  # seed only use once
+
+    def reset(self, reset_param: Optional[Dict] = None) -> None:
+        self._check_closed()
+        if reset_param is None:
+            env_ids = list(range(self._env_num))
+        else:
+            env_ids = list(reset_param.keys())
+            for env_id in reset_param:
+                self._reset_param[env_id] = reset_param[env_id]
+        self._reset_envs(env_ids)
+
+    def _reset_envs(self, env_ids: List[int]) -> None:
+        self._apply_pending_seeds(env_ids)
+        for env_id in env_ids:
+            self._env_states[env_id] = EnvState.RESET
+        groups = self._group_by_worker(env_ids)
+        for w, bucket in groups.items():
+            self._pipe_parents[w].send(['reset', {i: self._reset_param[i] for i in bucket}])
+        for w in groups.keys():
+            obs_batch = self._recv(w, self._reset_timeout)
+            for env_id, obs in obs_batch.items():
+                if obs is None:
+                    obs = self._obs_buffers[env_id].get()
+                self._ready_obs[env_id] = obs
+                self._env_states[env_id] = EnvState.RUN
+
+    def step(self, actions: Dict[int, Any]) -> Dict[int, namedtuple]:
+        self._check_closed()
+        timesteps = {}
+        groups = self._group_by_worker(list(actions.keys()))
+        for w, bucket in groups.items():
+            self._pipe_parents[w].send(['step', {i: actions[i] for i in bucket}])
+        for w in groups.keys():
+            results = self._recv(w, self._step_timeout)
+            for env_id, timestep in results.items():
+                if timestep.obs is None:
+                    timestep = timestep._replace(obs=self._obs_buffers[env_id].get())
+                timesteps[env_id] = timestep
+        reset_env_ids = []
+        for env_id, timestep in timesteps.items():
+            if timestep.done:
+                self._env_episode_count[env_id] += 1
+                if self._env_episode_count[env_id] < self._episode_num:
+                    if self._auto_reset:
+                        reset_env_ids.append(env_id)
+                    else:
+                        self._env_states[env_id] = EnvState.NEED_RESET
+                else:
+                    self._env_states[env_id] = EnvState.DONE
+            else:
+                self._ready_obs[env_id] = timestep.obs
+        if len(reset_env_ids) > 0:
+            self._reset_envs(reset_env_ids)
+        return timesteps
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        for parent_conn in self._pipe_parents:
+            parent_conn.send(['close', None])
+        for parent_conn in self._pipe_parents:
+            try:
+                parent_conn.recv()
+            except EOFError:
+                pass
+        for proc in self._workers:
+            proc.join()
+        for i in range(self._env_num):
+            self._env_states[i] = EnvState.VOID
+        self._env_ref.close()
+        self._closed = True
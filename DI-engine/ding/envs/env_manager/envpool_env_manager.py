@@ -1,4 +1,5 @@
 import gym
+import numbers
 from easydict import EasyDict
 from copy import deepcopy
 import numpy as np
@@ -114,6 +115,14 @@ class PoolEnvManager:
 
     def seed(self, seed: int, dynamic_seed=False) -> None:
         # The i-th environment seed in Envpool will be set with i+seed, so we don't do extra transformation here
+        if not isinstance(seed, numbers.Integral):
+            # envpool consumes one scalar base seed at launch and cannot be reseeded per
+            # env afterwards, so per-env seed arrays (e.g. PLR level seeds) would be
+            # silently ignored; fail loudly instead
+            raise TypeError(
+                "envpool only supports a scalar base seed applied at launch (env i plays seed+i), "
+                "per-env reseeding is not supported, but got: {}".format(type(seed))
+            )
         self._seed = seed
         logging.warning("envpool doesn't support dynamic_seed in different episode")
 
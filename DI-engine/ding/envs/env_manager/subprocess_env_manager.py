@@ -149,6 +149,37 @@ class ShmBufferContainer(object):
             return self._data.get()
 
 
+def shm_buffer_spec(obs_space) -> Tuple[Any, Any]:
+    """
+    Overview:
+        Derive the (dtype, shape) pair used to pre-allocate shared-memory obs buffers from an
+        observation space. Besides gym spaces, this supports the EnvElementInfo style spaces
+        some envs (e.g. SMAC) expose, whose shape attribute is a plain tuple or a dict of
+        array shapes; such spaces carry no dtype, so their components default to float32.
+    Arguments:
+        - obs_space: The observation space of the env to allocate buffers for.
+    Returns:
+        - dtype: Single dtype or dict of dtypes, matching the layout of the returned shape.
+        - shape: Single shape tuple or dict of shape tuples.
+    """
+    if isinstance(obs_space, gym.spaces.Dict):
+        # For multi_agent case, such as multiagent_mujoco and petting_zoo mpe.
+        # Now only for the case that each agent in the team have the same obs structure
+        # and corresponding shape.
+        shape = {k: v.shape for k, v in obs_space.spaces.items()}
+        dtype = {k: v.dtype for k, v in obs_space.spaces.items()}
+    else:
+        shape = obs_space.shape
+        dtype = getattr(obs_space, 'dtype', None)
+        if dtype is None:
+
+            def default_dtype(s):
+                return {k: default_dtype(v) for k, v in s.items()} if isinstance(s, dict) else np.float32
+
+            dtype = default_dtype(shape)
+    return dtype, shape
+
+
 class CloudPickleWrapper:
     """
     Overview:
@@ -241,16 +272,7 @@ class AsyncSubprocessEnvManager(BaseEnvManager):
         self._ready_obs = {env_id: None for env_id in range(self.env_num)}
         self._reset_param = {i: {} for i in range(self.env_num)}
         if self._shared_memory:
-            obs_space = self._observation_space
-            if isinstance(obs_space, gym.spaces.Dict):
-                # For multi_agent case, such as multiagent_mujoco and petting_zoo mpe.
-                # Now only for the case that each agent in the team have the same obs structure
-                # and corresponding shape.
-                shape = {k: v.shape for k, v in obs_space.spaces.items()}
-                dtype = {k: v.dtype for k, v in obs_space.spaces.items()}
-            else:
-                shape = obs_space.shape
-                dtype = obs_space.dtype
+            dtype, shape = shm_buffer_spec(self._observation_space)
             self._obs_buffers = {
                 env_id: ShmBufferContainer(dtype, shape, copy_on_get=self._copy_on_get)
                 for env_id in range(self.env_num)
@@ -156,12 +156,12 @@ class NGU(nn.Module):
             prev_reward_extrinsic = inputs['prev_reward_extrinsic']
         else:
             # train mode: pass into H timesteps mini-batch data (batchsize=train_batch_size)
-            prev_action = torch.cat(
-                [torch.ones_like(inputs['action'][:, 0].unsqueeze(1)) * (-1), inputs['action'][:, :-1]], dim=1
-            )  # (B, 1)  (B, H-1) -> (B, H, self.action_shape)
-            prev_reward_extrinsic = torch.cat(
-                [torch.zeros_like(inputs['reward'][:, 0].unsqueeze(1)), inputs['reward'][:, :-1]], dim=1
-            )  # (B, 1, nstep)  (B, H-1, nstep) -> (B, H, nstep)
+            # shift right by one step and write the null prefix in place, one allocation
+            # instead of the ones_like/zeros_like + cat pair
+            prev_action = inputs['action'].roll(1, dims=1)  # (B, H) -> (B, H), t=0 is the null action
+            prev_action[:, 0] = -1
+            prev_reward_extrinsic = inputs['reward'].roll(1, dims=1)  # (B, H, nstep), t=0 is the null reward
+            prev_reward_extrinsic[:, 0] = 0.
         beta = inputs['beta']  # beta_index
         if inference:
             # collect, eval mode: pass into one timestep mini-batch data (batchsize=env_num)
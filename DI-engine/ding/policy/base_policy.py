@@ -2,12 +2,14 @@ from abc import ABC, abstractmethod
 from collections import namedtuple
 from typing import Optional, List, Dict, Any, Tuple, Union
 
+import contextlib
 import torch
 import copy
 from easydict import EasyDict
 
 from ding.model import create_model
-from ding.utils import import_module, allreduce, broadcast, get_rank, allreduce_async, synchronize, POLICY_REGISTRY
+from ding.utils import import_module, allreduce, broadcast, get_rank, allreduce_async, synchronize, POLICY_REGISTRY, \
+    one_time_warning
 
 
 class Policy(ABC):
@@ -86,6 +88,31 @@ class Policy(ABC):
                 if self._cuda:
                     torch.cuda.set_device(self._rank % torch.cuda.device_count())
                     model.cuda()
+            # optional cudnn autotune for static input shapes (policy.cudnn_benchmark=True): when
+            # the learn batches keep a fixed [B, T, ...] layout the one-off kernel search pays for
+            # itself; also allows tf32 matmuls where the torch version supports selecting it
+            if cfg.get('cudnn_benchmark', False) and self._cuda:
+                torch.backends.cudnn.benchmark = True
+                if hasattr(torch, 'set_float32_matmul_precision'):
+                    torch.set_float32_matmul_precision('high')
+            # optional channels-last weight layout for conv encoders (policy.channels_last=True),
+            # which lets cudnn pick NHWC tensor-core kernels under bf16/fp16 autocast; inputs are
+            # converted on entry of the conv ops, only the parameter layout is changed here
+            if cfg.get('channels_last', False):
+                model = model.to(memory_format=torch.channels_last)
+            # optional torch.compile acceleration, e.g. policy.compile=dict(enable=True, mode='reduce-overhead');
+            # the compiled forward is shared by learn/collect/eval wrappers since they delegate to the same model
+            compile_cfg = cfg.get('compile', None)
+            if compile_cfg is not None and compile_cfg.get('enable', False):
+                if hasattr(torch, 'compile'):
+                    model.forward = torch.compile(
+                        model.forward,
+                        backend=compile_cfg.get('backend', 'inductor'),
+                        mode=compile_cfg.get('mode', None),
+                        fullgraph=compile_cfg.get('fullgraph', False),
+                    )
+                else:
+                    one_time_warning("torch.compile needs torch>=2.0, fall back to the eager model")
             self._model = model
             self._device = 'cuda:{}'.format(self._rank % torch.cuda.device_count()) if self._cuda else 'cpu'
         else:
@@ -131,6 +158,17 @@ class Policy(ABC):
             else:
                 raise RuntimeError("invalid model: {}".format(type(model)))
 
+    def _amp_context(self):
+        """
+        Overview:
+            Context manager for the learn-mode forward: bf16 autocast when the policy sets
+            ``self._amp_enabled`` (config key ``learn.amp_dtype='bf16'``), otherwise a no-op.
+            bf16 keeps the fp32 exponent range, so no grad scaler is needed.
+        """
+        if getattr(self, '_amp_enabled', False):
+            return torch.autocast(device_type='cuda', dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+
     @property
     def cfg(self) -> EasyDict:
         return self._cfg
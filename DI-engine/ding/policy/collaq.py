@@ -3,7 +3,7 @@ from collections import namedtuple
 import torch
 import copy
 
-from ding.torch_utils import to_device, RMSprop
+from ding.torch_utils import to_device, to_device_async, RMSprop
 from ding.rl_utils import v_1step_td_data, v_1step_td_error, get_train_sample
 from ding.model import model_wrap
 from ding.utils import POLICY_REGISTRY
@@ -187,7 +187,7 @@ class CollaQPolicy(Policy):
         # data preprocess
         data = timestep_collate(data)
         if self._cuda:
-            data = to_device(data, self._device)
+            data = to_device_async(data, self._device)
         if use_priority_IS_weight:
             assert use_priority, "Use IS Weight correction, but Priority is not used."
         if use_priority and use_priority_IS_weight:
@@ -200,6 +200,28 @@ class CollaQPolicy(Policy):
         data['done'] = data['done'].float()
         return data
 
+    def _derive_alone_obs(self, obs: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        r"""
+        Overview:
+            Derive ``agent_alone_state`` and ``agent_alone_padding_state`` from ``agent_state`` when the
+            env does not emit them (``env.obs_alone=False``). The alone obs is the agent obs with the
+            ally feature block removed (resp. zeroed out), so transmitting and storing both is
+            redundant; reconstructing them next to the model is two slices on the batched tensor.
+        Arguments:
+            - obs (:obj:`Dict[str, torch.Tensor]`): The batched obs dict, updated in place.
+        Returns:
+            - obs (:obj:`Dict[str, torch.Tensor]`): The obs dict with both alone views filled in.
+        """
+        if 'agent_alone_state' in obs:
+            return obs
+        start, end = self._cfg.model.ally_feature_range
+        agent_state = obs['agent_state']
+        obs['agent_alone_state'] = torch.cat([agent_state[..., :start], agent_state[..., end:]], dim=-1)
+        padding = agent_state.clone()
+        padding[..., start:end] = 0
+        obs['agent_alone_padding_state'] = padding
+        return obs
+
     def _forward_learn(self, data: dict) -> Dict[str, Any]:
         r"""
         Overview:
@@ -223,6 +245,8 @@ class CollaQPolicy(Policy):
         # ====================
         self._learn_model.train()
         self._target_model.train()
+        self._derive_alone_obs(data['obs'])
+        self._derive_alone_obs(data['next_obs'])
         # for hidden_state plugin, we need to reset the main model and target model
         self._learn_model.reset(state=data['prev_state'][0])
         self._target_model.reset(state=data['prev_state'][0])
@@ -341,7 +365,7 @@ class CollaQPolicy(Policy):
         data = default_collate(list(data.values()))
         if self._cuda:
             data = to_device(data, self._device)
-        data = {'obs': data}
+        data = {'obs': self._derive_alone_obs(data)}
         self._collect_model.eval()
         with torch.no_grad():
             output = self._collect_model.forward(data, eps=eps, data_id=data_id)
@@ -416,7 +440,7 @@ class CollaQPolicy(Policy):
         data = default_collate(list(data.values()))
         if self._cuda:
             data = to_device(data, self._device)
-        data = {'obs': data}
+        data = {'obs': self._derive_alone_obs(data)}
         self._eval_model.eval()
         with torch.no_grad():
             output = self._eval_model.forward(data, data_id=data_id)
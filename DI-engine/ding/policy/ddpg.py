@@ -3,7 +3,7 @@ from collections import namedtuple
 import torch
 import copy
 
-from ding.torch_utils import Adam, to_device
+from ding.torch_utils import Adam, to_device, to_device_async
 from ding.rl_utils import v_1step_td_data, v_1step_td_error, get_train_sample
 from ding.model import model_wrap
 from ding.utils import POLICY_REGISTRY
@@ -163,6 +163,8 @@ class DDPGPolicy(Policy):
         """
         self._priority = self._cfg.priority
         self._priority_IS_weight = self._cfg.priority_IS_weight
+        # cache the per-iteration config reads, EasyDict attribute access is a python fallback
+        self._ignore_done = self._cfg.learn.ignore_done
         # actor and critic optimizer
         self._optimizer_actor = Adam(
             self._model.actor.parameters(),
@@ -177,6 +179,8 @@ class DDPGPolicy(Policy):
         self._gamma = self._cfg.learn.discount_factor
         self._actor_update_freq = self._cfg.learn.actor_update_freq
         self._twin_critic = self._cfg.model.twin_critic  # True for TD3, False for DDPG
+        # learn.amp_dtype='bf16' runs the learn-mode model forward under bf16 autocast
+        self._amp_enabled = self._cuda and self._cfg.learn.get('amp_dtype', None) == 'bf16'
 
         # main and target models
         self._target_model = copy.deepcopy(self._model)
@@ -219,13 +223,14 @@ class DDPGPolicy(Policy):
         loss_dict = {}
         data = default_preprocess_learn(
             data,
-            use_priority=self._cfg.priority,
-            use_priority_IS_weight=self._cfg.priority_IS_weight,
-            ignore_done=self._cfg.learn.ignore_done,
+            use_priority=self._priority,
+            use_priority_IS_weight=self._priority_IS_weight,
+            ignore_done=self._ignore_done,
             use_nstep=False
         )
         if self._cuda:
-            data = to_device(data, self._device)
+            # pinned + overlapped H2D copy, the transfer runs on a dedicated stream
+            data = to_device_async(data, self._device)
         # ====================
         # critic learn forward
         # ====================
@@ -236,7 +241,8 @@ class DDPGPolicy(Policy):
         if self._reward_batch_norm:
             reward = (reward - reward.mean()) / (reward.std() + 1e-8)
         # current q value
-        q_value = self._learn_model.forward(data, mode='compute_critic')['q_value']
+        with self._amp_context():
+            q_value = self._learn_model.forward(data, mode='compute_critic')['q_value']
         q_value_dict = {}
         if self._twin_critic:
             q_value_dict['q_value'] = q_value[0].mean()
@@ -244,7 +250,7 @@ class DDPGPolicy(Policy):
         else:
             q_value_dict['q_value'] = q_value.mean()
         # target q value.
-        with torch.no_grad():
+        with torch.no_grad(), self._amp_context():
             next_actor_data = self._target_model.forward(next_obs, mode='compute_actor')
             next_actor_data['obs'] = next_obs
             target_q_value = self._target_model.forward(next_actor_data, mode='compute_critic')['q_value']
@@ -278,12 +284,13 @@ class DDPGPolicy(Policy):
         # ===============================
         # actor updates every ``self._actor_update_freq`` iters
         if (self._forward_learn_cnt + 1) % self._actor_update_freq == 0:
-            actor_data = self._learn_model.forward(data['obs'], mode='compute_actor')
-            actor_data['obs'] = data['obs']
-            if self._twin_critic:
-                actor_loss = -self._learn_model.forward(actor_data, mode='compute_critic')['q_value'][0].mean()
-            else:
-                actor_loss = -self._learn_model.forward(actor_data, mode='compute_critic')['q_value'].mean()
+            with self._amp_context():
+                actor_data = self._learn_model.forward(data['obs'], mode='compute_actor')
+                actor_data['obs'] = data['obs']
+                if self._twin_critic:
+                    actor_loss = -self._learn_model.forward(actor_data, mode='compute_critic')['q_value'][0].mean()
+                else:
+                    actor_loss = -self._learn_model.forward(actor_data, mode='compute_critic')['q_value'].mean()
 
             loss_dict['actor_loss'] = actor_loss
             # actor update
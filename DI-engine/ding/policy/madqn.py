@@ -3,7 +3,7 @@ from collections import namedtuple
 import torch
 import copy
 
-from ding.torch_utils import RMSprop, to_device
+from ding.torch_utils import RMSprop, to_device, to_device_async
 from ding.rl_utils import v_1step_td_data, v_1step_td_error, get_train_sample, \
     v_nstep_td_data, v_nstep_td_error, get_nstep_return_data
 from ding.model import model_wrap
@@ -139,7 +139,7 @@ class MADQNPolicy(QMIXPolicy):
         # data preprocess
         data = timestep_collate(data)
         if self._cuda:
-            data = to_device(data, self._device)
+            data = to_device_async(data, self._device)
         data['weight'] = data.get('weight', None)
         data['done'] = data['done'].float()
         return data
@@ -196,18 +196,16 @@ class MADQNPolicy(QMIXPolicy):
                     target_v = self._gamma * target_total_q + data['reward']
         else:
             data['reward'] = data['reward'].permute(0, 2, 1).contiguous()
-            loss = []
-            td_error_per_sample = []
-            for t in range(self._cfg.collect.unroll_len):
-                v_data = v_nstep_td_data(
-                    total_q[t], target_total_q[t], data['reward'][t], data['done'][t], data['weight'], self._gamma
-                )
-                # calculate v_nstep_td critic_loss
-                loss_i, td_error_per_sample_i = v_nstep_td_error(v_data, self._gamma, self._nstep)
-                loss.append(loss_i)
-                td_error_per_sample.append(td_error_per_sample_i)
-            loss = sum(loss) / (len(loss) + 1e-8)
-            td_error_per_sample = sum(td_error_per_sample) / (len(td_error_per_sample) + 1e-8)
+            # fold the unroll dim T into the batch dim and compute all nstep targets in one
+            # td call, instead of T python-level invocations per update
+            T = data['reward'].shape[0]
+            reward = data['reward'].permute(1, 0, 2).reshape(self._nstep, -1)
+            weight = data['weight'].repeat(T) if data['weight'] is not None else None
+            v_data = v_nstep_td_data(
+                total_q.reshape(-1), target_total_q.reshape(-1), reward, data['done'].reshape(-1), weight, self._gamma
+            )
+            # calculate v_nstep_td critic_loss
+            loss, td_error_per_sample = v_nstep_td_error(v_data, self._gamma, self._nstep)
 
         self._optimizer_current.zero_grad()
         loss.backward()
@@ -230,15 +228,12 @@ class MADQNPolicy(QMIXPolicy):
             )
             cooperation_loss, _ = v_1step_td_error(v_data, self._gamma)
         else:
-            cooperation_loss_all = []
-            for t in range(self._cfg.collect.unroll_len):
-                v_data = v_nstep_td_data(
-                    cooperation_total_q[t], cooperation_target_total_q[t], data['reward'][t], data['done'][t],
-                    data['weight'], self._gamma
-                )
-                cooperation_loss, _ = v_nstep_td_error(v_data, self._gamma, self._nstep)
-                cooperation_loss_all.append(cooperation_loss)
-            cooperation_loss = sum(cooperation_loss_all) / (len(cooperation_loss_all) + 1e-8)
+            # same unroll-dim folding as the current-q loss above
+            v_data = v_nstep_td_data(
+                cooperation_total_q.reshape(-1), cooperation_target_total_q.reshape(-1), reward,
+                data['done'].reshape(-1), weight, self._gamma
+            )
+            cooperation_loss, _ = v_nstep_td_error(v_data, self._gamma, self._nstep)
         self._optimizer_cooperation.zero_grad()
         cooperation_loss.backward()
         cooperation_grad_norm = torch.nn.utils.clip_grad_norm_(
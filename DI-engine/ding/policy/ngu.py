@@ -3,7 +3,7 @@ from collections import namedtuple
 import torch
 import copy
 
-from ding.torch_utils import Adam, to_device
+from ding.torch_utils import Adam, to_device, to_device_async
 from ding.rl_utils import q_nstep_td_data, q_nstep_td_error, q_nstep_td_error_with_rescale, get_nstep_return_data, \
     get_train_sample
 from ding.model import model_wrap
@@ -150,11 +150,15 @@ class NGUPolicy(Policy):
         """
         self._priority = self._cfg.priority
         self._priority_IS_weight = self._cfg.priority_IS_weight
+        # cache the per-iteration config reads, EasyDict attribute access is a python fallback
+        self._ignore_done = self._cfg.learn.ignore_done
         self._optimizer = Adam(self._model.parameters(), lr=self._cfg.learn.learning_rate)
         self._gamma = self._cfg.discount_factor
         self._nstep = self._cfg.nstep
         self._burnin_step = self._cfg.burnin_step
         self._value_rescale = self._cfg.learn.value_rescale
+        # learn.amp_dtype='bf16' runs the learn-mode model forward under bf16 autocast
+        self._amp_enabled = self._cuda and self._cfg.learn.get('amp_dtype', None) == 'bf16'
 
         self._target_model = copy.deepcopy(self._model)
         # here we should not adopt the 'assign' mode of target network here because the reset bug
@@ -197,7 +201,12 @@ class NGUPolicy(Policy):
         # data preprocess
         data = timestep_collate(data)
         if self._cuda:
-            data = to_device(data, self._device)
+            # pinned + overlapped H2D copy, the transfer runs on a dedicated stream
+            data = to_device_async(data, self._device)
+        if data['obs'].dtype == torch.uint8:
+            # uint8 replay frames (env cfg scale=False): normalize once on device,
+            # the replay buffer and the H2D copy then carry 4x less data
+            data['obs'] = data['obs'].float().div_(255.)
 
         if self._priority_IS_weight:
             assert self._priority, "Use IS Weight correction, but Priority is not used."
@@ -210,7 +219,7 @@ class NGUPolicy(Policy):
 
         # data['done'], data['weight'], data['value_gamma'] is used in def _forward_learn() to calculate
         # the q_nstep_td_error, should be length of [self._sequence_len-self._burnin_step]
-        ignore_done = self._cfg.learn.ignore_done
+        ignore_done = self._ignore_done
         if ignore_done:
             data['done'] = [None for _ in range(self._sequence_len - bs - self._nstep)]
         else:
@@ -232,12 +241,10 @@ class NGUPolicy(Policy):
             data['weight'] = data['weight'] * torch.ones_like(data['done'])
             # every timestep in sequence has same weight, which is the _priority_IS_weight in PER
 
-        # the burnin_nstep_obs is used to calculate the init hidden state of rnn for the calculation of the q_value,
-        # target_q_value, and target_q_action
-        data['burnin_nstep_obs'] = data['obs'][:bs + self._nstep]
-        data['burnin_nstep_action'] = data['action'][:bs + self._nstep]
-        data['burnin_nstep_reward'] = data['reward'][:bs + self._nstep]
-        data['burnin_nstep_beta'] = data['beta'][:bs + self._nstep]
+        # the full action/reward sequences are fed to the fused no_grad forward in _forward_learn,
+        # which computes the burnin hidden states, target_q_value and target_q_action in one unroll
+        data['seq_action'] = data['action']
+        data['seq_reward'] = data['reward']
 
         # split obs into three parts 'burnin_obs' [0:bs], 'main_obs' [bs:bs+nstep], 'target_obs' [bs+nstep:]
         # data['burnin_obs'] = data['obs'][:bs]
@@ -285,21 +292,27 @@ class NGUPolicy(Policy):
         self._learn_model.reset(data_id=None, state=data['prev_state'][0])
         self._target_model.reset(data_id=None, state=data['prev_state'][0])
 
-        if len(data['burnin_nstep_obs']) != 0:
-            with torch.no_grad():
-                inputs = {
-                    'obs': data['burnin_nstep_obs'],
-                    'action': data['burnin_nstep_action'],
-                    'reward': data['burnin_nstep_reward'],
-                    'beta': data['burnin_nstep_beta'],
-                    'enable_fast_timestep': True
-                }
-                tmp = self._learn_model.forward(
-                    inputs, saved_state_timesteps=[self._burnin_step, self._burnin_step + self._nstep]
-                )
-                tmp_target = self._target_model.forward(
-                    inputs, saved_state_timesteps=[self._burnin_step, self._burnin_step + self._nstep]
-                )
+        # fuse the burnin forward with the no_grad target/argmax forward: both models unroll
+        # the whole sequence once instead of a burnin segment plus a target segment, which
+        # covers the same timesteps with the same state continuity but halves the forward
+        # calls and the rnn setup cost per mini-batch
+        with torch.no_grad(), self._amp_context():
+            inputs = {
+                'obs': data['obs'],
+                'action': data['seq_action'],
+                'reward': data['seq_reward'],
+                'beta': data['beta'],
+                'enable_fast_timestep': True
+            }
+            full_output = self._learn_model.forward(
+                inputs, saved_state_timesteps=[self._burnin_step, self._burnin_step + self._nstep]
+            )
+            full_output_target = self._target_model.forward(
+                inputs, saved_state_timesteps=[self._burnin_step, self._burnin_step + self._nstep]
+            )
+            target_q_value = full_output_target['logit'][self._burnin_step + self._nstep:]
+            # argmax_action double_dqn
+            target_q_action = full_output['action'][self._burnin_step + self._nstep:]
 
         inputs = {
             'obs': data['main_obs'],
@@ -308,23 +321,9 @@ class NGUPolicy(Policy):
             'beta': data['main_beta'],
             'enable_fast_timestep': True
         }
-        self._learn_model.reset(data_id=None, state=tmp['saved_state'][0])
-        q_value = self._learn_model.forward(inputs)['logit']
-
-        self._learn_model.reset(data_id=None, state=tmp['saved_state'][1])
-        self._target_model.reset(data_id=None, state=tmp_target['saved_state'][1])
-
-        next_inputs = {
-            'obs': data['target_obs'],
-            'action': data['target_action'],
-            'reward': data['target_reward'],
-            'beta': data['target_beta'],
-            'enable_fast_timestep': True
-        }
-        with torch.no_grad():
-            target_q_value = self._target_model.forward(next_inputs)['logit']
-            # argmax_action double_dqn
-            target_q_action = self._learn_model.forward(next_inputs)['action']
+        self._learn_model.reset(data_id=None, state=full_output['saved_state'][0])
+        with self._amp_context():
+            q_value = self._learn_model.forward(inputs)['logit']
 
         action, reward, done, weight = data['action'], data['reward'], data['done'], data['weight']
         value_gamma = [
@@ -461,6 +460,9 @@ class NGUPolicy(Policy):
             beta_index = to_device(beta_index, self._device)
             prev_action = to_device(prev_action, self._device)
             prev_reward_extrinsic = to_device(prev_reward_extrinsic, self._device)
+        if obs.dtype == torch.uint8:
+            # uint8 frames from the env (scale=False), normalize on device
+            obs = obs.float().div_(255.)
         # TODO(pu): add prev_reward_intrinsic to network input,
         #  reward uses some kind of embedding instead of 1D value
         data = {
@@ -573,6 +575,9 @@ class NGUPolicy(Policy):
             beta_index = to_device(beta_index, self._device)
             prev_action = to_device(prev_action, self._device)
             prev_reward_extrinsic = to_device(prev_reward_extrinsic, self._device)
+        if obs.dtype == torch.uint8:
+            # uint8 frames from the env (scale=False), normalize on device
+            obs = obs.float().div_(255.)
         # TODO(pu): add prev_reward_intrinsic to network input,
         #  reward uses some kind of embedding instead of 1D value
         data = {
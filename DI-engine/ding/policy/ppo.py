@@ -4,7 +4,7 @@ import torch
 import copy
 import numpy as np
 
-from ding.torch_utils import Adam, to_device, unsqueeze, ContrastiveLoss
+from ding.torch_utils import Adam, to_device, to_device_async, unsqueeze, ContrastiveLoss
 from ding.rl_utils import ppo_data, ppo_error, ppo_policy_error, ppo_policy_data, get_gae_with_default_last_value, \
     v_nstep_td_data, v_nstep_td_error, get_nstep_return_data, get_train_sample, gae, gae_data, ppo_error_continuous, \
     get_gae, ppo_policy_error_continuous
@@ -763,7 +763,8 @@ class PPOOffPolicy(Policy):
         """
         data = default_preprocess_learn(data, ignore_done=self._cfg.learn.ignore_done, use_nstep=self._nstep_return)
         if self._cuda:
-            data = to_device(data, self._device)
+            # pinned + overlapped H2D copy, the transfer runs on a dedicated stream
+            data = to_device_async(data, self._device)
         # ====================
         # PPO forward
         # ====================
@@ -7,7 +7,7 @@ import torch
 from ding.model import model_wrap
 from ding.rl_utils import q_nstep_td_data, q_nstep_td_error, q_nstep_td_error_with_rescale, get_nstep_return_data, \
     get_train_sample
-from ding.torch_utils import Adam, to_device
+from ding.torch_utils import Adam, to_device, to_device_async
 from ding.utils import POLICY_REGISTRY
 from ding.utils.data import timestep_collate, default_collate, default_decollate
 from .base_policy import Policy
@@ -148,11 +148,15 @@ class R2D2Policy(Policy):
         """
         self._priority = self._cfg.priority
         self._priority_IS_weight = self._cfg.priority_IS_weight
+        # cache the per-iteration config reads, EasyDict attribute access is a python fallback
+        self._ignore_done = self._cfg.learn.ignore_done
         self._optimizer = Adam(self._model.parameters(), lr=self._cfg.learn.learning_rate)
         self._gamma = self._cfg.discount_factor
         self._nstep = self._cfg.nstep
         self._burnin_step = self._cfg.burnin_step
         self._value_rescale = self._cfg.learn.value_rescale
+        # learn.amp_dtype='bf16' runs the learn-mode model forward under bf16 autocast
+        self._amp_enabled = self._cuda and self._cfg.learn.get('amp_dtype', None) == 'bf16'
 
         self._target_model = copy.deepcopy(self._model)
         self._target_model = model_wrap(
@@ -190,7 +194,8 @@ class R2D2Policy(Policy):
         # data preprocess
         data = timestep_collate(data)
         if self._cuda:
-            data = to_device(data, self._device)
+            # pinned + overlapped H2D copy, the transfer runs on a dedicated stream
+            data = to_device_async(data, self._device)
 
         if self._priority_IS_weight:
             assert self._priority, "Use IS Weight correction, but Priority is not used."
@@ -203,7 +208,7 @@ class R2D2Policy(Policy):
 
         # data['done'], data['weight'], data['value_gamma'] is used in def _forward_learn() to calculate
         # the q_nstep_td_error, should be length of [self._sequence_len-self._burnin_step]
-        ignore_done = self._cfg.learn.ignore_done
+        ignore_done = self._ignore_done
         if ignore_done:
             data['done'] = [None for _ in range(self._sequence_len - burnin_step)]
         else:
@@ -230,11 +235,9 @@ class R2D2Policy(Policy):
         # cut the seq_len from burn_in step to (seq_len - nstep) step
         data['reward'] = data['reward'][burnin_step:-self._nstep]
 
-        # the burnin_nstep_obs is used to calculate the init hidden state of rnn for the calculation of the q_value,
-        # target_q_value, and target_q_action
-
         # these slicing are all done in the outermost layer, which is the seq_len dim
-        data['burnin_nstep_obs'] = data['obs'][:burnin_step + self._nstep]
+        # the full data['obs'] is fed to the fused no_grad forward in _forward_learn, which computes
+        # the burnin hidden states, target_q_value and target_q_action in one unroll
         # the main_obs is used to calculate the q_value, the [bs:-self._nstep] means using the data from
         # [bs] timestep to [self._sequence_len-self._nstep] timestep
         data['main_obs'] = data['obs'][burnin_step:-self._nstep]
@@ -265,28 +268,27 @@ class R2D2Policy(Policy):
         self._learn_model.reset(data_id=None, state=data['prev_state'][0])
         self._target_model.reset(data_id=None, state=data['prev_state'][0])
 
-        if len(data['burnin_nstep_obs']) != 0:
-            with torch.no_grad():
-                inputs = {'obs': data['burnin_nstep_obs'], 'enable_fast_timestep': True}
-                burnin_output = self._learn_model.forward(
-                    inputs, saved_state_timesteps=[self._burnin_step, self._burnin_step + self._nstep]
-                )  # keys include 'logit', 'hidden_state' 'saved_state', \
-                # 'action', for their specific dim, please refer to DRQN model
-                burnin_output_target = self._target_model.forward(
-                    inputs, saved_state_timesteps=[self._burnin_step, self._burnin_step + self._nstep]
-                )
-
-        self._learn_model.reset(data_id=None, state=burnin_output['saved_state'][0])
-        inputs = {'obs': data['main_obs'], 'enable_fast_timestep': True}
-        q_value = self._learn_model.forward(inputs)['logit']
-        self._learn_model.reset(data_id=None, state=burnin_output['saved_state'][1])
-        self._target_model.reset(data_id=None, state=burnin_output_target['saved_state'][1])
-
-        next_inputs = {'obs': data['target_obs'], 'enable_fast_timestep': True}
-        with torch.no_grad():
-            target_q_value = self._target_model.forward(next_inputs)['logit']
+        # fuse the burnin forward with the no_grad target/argmax forward: both models unroll
+        # the whole sequence once instead of a burnin segment plus a target segment, which
+        # covers the same timesteps with the same state continuity but halves the forward
+        # calls and the rnn setup cost per mini-batch
+        with torch.no_grad(), self._amp_context():
+            inputs = {'obs': data['obs'], 'enable_fast_timestep': True}
+            full_output = self._learn_model.forward(
+                inputs, saved_state_timesteps=[self._burnin_step, self._burnin_step + self._nstep]
+            )  # keys include 'logit', 'hidden_state' 'saved_state', \
+            # 'action', for their specific dim, please refer to DRQN model
+            full_output_target = self._target_model.forward(
+                inputs, saved_state_timesteps=[self._burnin_step, self._burnin_step + self._nstep]
+            )
+            target_q_value = full_output_target['logit'][self._burnin_step + self._nstep:]
             # argmax_action double_dqn
-            target_q_action = self._learn_model.forward(next_inputs)['action']
+            target_q_action = full_output['action'][self._burnin_step + self._nstep:]
+
+        self._learn_model.reset(data_id=None, state=full_output['saved_state'][0])
+        inputs = {'obs': data['main_obs'], 'enable_fast_timestep': True}
+        with self._amp_context():
+            q_value = self._learn_model.forward(inputs)['logit']
 
         action, reward, done, weight = data['action'], data['reward'], data['done'], data['weight']
         value_gamma = data['value_gamma']
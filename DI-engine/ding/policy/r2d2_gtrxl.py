@@ -1,13 +1,15 @@
 import copy
 import sys
 from collections import namedtuple
+
+import numpy as np
 from typing import List, Dict, Any, Tuple, Union, Optional
 
 from ding.model import model_wrap
 from ding.rl_utils import q_nstep_td_data, q_nstep_td_error, q_nstep_td_error_with_rescale, get_nstep_return_data, \
     get_train_sample
 from ding.torch_utils import Adam, to_device
-from ding.utils import POLICY_REGISTRY
+from ding.utils import POLICY_REGISTRY, one_time_warning
 from ding.utils.data import timestep_collate, default_collate, default_decollate
 from .base_policy import Policy
 import torch
@@ -106,7 +108,11 @@ class R2D2GTrXLPolicy(Policy):
             # (bool) whether use value_rescale function for predicted value
             value_rescale=False,
             # 'zero' or 'old', how to initialize the memory in training
-            init_memory='zero'
+            init_memory='zero',
+            # (bool) whether to script the GTrXL attention/mlp submodules with torch.jit
+            use_jit=False,
+            # (bool) whether to fuse the loss/priority reductions with torch.compile
+            compile_loss=False,
         ),
         collect=dict(
             # NOTE it is important that don't include key n_sample here, to make sure self._traj_len=INF
@@ -155,7 +161,19 @@ class R2D2GTrXLPolicy(Policy):
         """
         self._priority = self._cfg.priority
         self._priority_IS_weight = self._cfg.priority_IS_weight
-        self._optimizer = Adam(self._model.parameters(), lr=self._cfg.learn.learning_rate)
+        if self._cuda:
+            # fused Adam performs the whole update in one multi-tensor kernel instead of ~3
+            # launches per parameter tensor; this policy uses none of the grad-clip extras of
+            # the ding Adam wrapper, so the plain torch optimizer is a drop-in. Fall back on
+            # older torch versions without the fused implementation.
+            try:
+                self._optimizer = torch.optim.Adam(
+                    self._model.parameters(), lr=self._cfg.learn.learning_rate, fused=True
+                )
+            except TypeError:
+                self._optimizer = Adam(self._model.parameters(), lr=self._cfg.learn.learning_rate)
+        else:
+            self._optimizer = Adam(self._model.parameters(), lr=self._cfg.learn.learning_rate)
         self._gamma = self._cfg.discount_factor
         self._nstep = self._cfg.nstep
         self._burnin_step = self._cfg.burnin_step
@@ -164,8 +182,39 @@ class R2D2GTrXLPolicy(Policy):
         self._value_rescale = self._cfg.learn.value_rescale
         self._init_memory = self._cfg.learn.init_memory
         assert self._init_memory in ['zero', 'old']
+        # batch-size -> on-device arange, cached to avoid an H2D copy per train iteration
+        self._batch_range_cache = {}
+        # cached zero memory state shared by the per-step resets in the 'zero' init_memory mode
+        self._zero_memory = None
+        # dedicated stream for host->device copies of the learn batch
+        self._h2d_stream = torch.cuda.Stream() if self._cuda else None
+        # side stream to run the double-DQN argmax forward concurrently with the target forward
+        self._aux_stream = torch.cuda.Stream() if self._cuda else None
+        if self._cfg.learn.compile_loss and hasattr(torch, 'compile'):
+            # the loss/priority tail is a chain of small elementwise/reduction kernels over fixed
+            # (T, B) shapes, which inductor can fuse and replay as a single captured graph
+            self._compute_loss_and_priority = torch.compile(
+                self._compute_loss_and_priority, mode='reduce-overhead', fullgraph=False
+            )
 
-        self._target_model = copy.deepcopy(self._model)
+        # build the target network through the model factory and copy the weights over, instead of
+        # deepcopy-ing the live (possibly CUDA) model through Python pickling; fall back to deepcopy
+        # when the policy was constructed with an externally provided model the factory can't rebuild
+        try:
+            self._target_model = self._create_model(self._cfg, None)
+            self._target_model.load_state_dict(self._model.state_dict())
+            self._target_model.to(self._device)
+        except Exception:
+            self._target_model = copy.deepcopy(self._model)
+
+        if self._cfg.learn.use_jit:
+            # script the transformer leaf modules of both networks; on failure (TorchScript
+            # does not support every construct) keep the eager modules
+            try:
+                self._jit_script_model(self._model)
+                self._jit_script_model(self._target_model)
+            except Exception as e:
+                one_time_warning('torch.jit.script on GTrXL submodules failed, fallback to eager mode: {}'.format(e))
 
         self._target_model = model_wrap(
             self._target_model,
@@ -180,6 +229,73 @@ class R2D2GTrXLPolicy(Policy):
         self._learn_model.reset()
         self._target_model.reset()
 
+    def _jit_script_model(self, model: torch.nn.Module) -> None:
+        r"""
+        Overview:
+            Script the GTrXL leaf submodules (attention and per-block mlp) with ``torch.jit.script`` \
+            to remove their per-timestep Python dispatch overhead. The top-level wrappers are left \
+            untouched because they rely on dicts and dynamic control flow unsupported by TorchScript.
+        """
+        from ding.torch_utils.network.gtrxl import GatedTransformerXLLayer
+        for m in model.modules():
+            if isinstance(m, GatedTransformerXLLayer):
+                m.attention = torch.jit.script(m.attention)
+                m.mlp = torch.jit.script(m.mlp)
+
+    def _fast_collate(self, data: List[Any]) -> Any:
+        r"""
+        Overview:
+            Fast path of ``default_collate`` for the per-step inference batch: when every env \
+            returns a numpy obs with the same shape and dtype, batch them with one ``np.stack`` \
+            and a single (pinned, async) host->device copy, skipping the per-env tensor \
+            conversions of the generic collate. Falls back to ``default_collate`` otherwise.
+        """
+        elem = data[0]
+        if isinstance(elem, np.ndarray) and all(
+                isinstance(d, np.ndarray) and d.shape == elem.shape and d.dtype == elem.dtype for d in data
+        ):
+            batch = torch.from_numpy(np.stack(data))
+            if self._cuda:
+                batch = batch.pin_memory().to(self._device, non_blocking=True)
+            return batch
+        batch = default_collate(data)
+        if self._cuda:
+            batch = to_device(batch, self._device)
+        return batch
+
+    def _fast_decollate(self, output: Dict[str, Any]) -> List[Any]:
+        r"""
+        Overview:
+            Fast path of ``default_decollate`` for the per-step inference output: a flat dict of \
+            tensors is sliced with ``torch.unbind`` instead of the generic recursion. Keeps the \
+            same per-element shapes as ``default_decollate`` and falls back to it for anything \
+            more structured (e.g. outputs carrying ``prev_state``).
+        """
+        if any(k in output for k in ('prev_state', 'prev_actor_state', 'prev_critic_state')) or \
+                not all(isinstance(v, torch.Tensor) for v in output.values()):
+            return default_decollate(output)
+        tmp = {
+            k: torch.unbind(v, dim=0) if v.dim() > 1 else torch.split(v, 1, dim=0)
+            for k, v in output.items()
+        }
+        B = len(next(iter(tmp.values())))
+        return [{k: tmp[k][i] for k in tmp} for i in range(B)]
+
+    def _pin_data(self, data: Any) -> Any:
+        r"""
+        Overview:
+            Recursively pin the tensor leaves of the collated learn batch, so that the following \
+            host->device copies can be issued asynchronously on ``self._h2d_stream``.
+        """
+        if isinstance(data, torch.Tensor):
+            return data.pin_memory()
+        elif isinstance(data, dict):
+            return {k: self._pin_data(v) for k, v in data.items()}
+        elif isinstance(data, list):
+            return [self._pin_data(d) for d in data]
+        else:
+            return data
+
     def _data_preprocess_learn(self, data: List[Dict[str, Any]]) -> dict:
         r"""
         Overview:
@@ -196,17 +312,33 @@ class R2D2GTrXLPolicy(Policy):
             # from 'data'
             prev_mem = [b['prev_memory'][0] for b in data]
             prev_mem_target = [b['prev_memory'][self._nstep] for b in data]
-            # stack the memory entries along the batch dimension,
-            # reshape the new memory to have shape (layer_num+1, memory_len, bs, embedding_dim) compatible with GTrXL
-            prev_mem_batch = torch.stack(prev_mem, 0).permute(1, 2, 0, 3)
-            prev_mem_target_batch = torch.stack(prev_mem_target, 0).permute(1, 2, 0, 3)
+            # stack the memory entries directly along dim 2 so that the new memory is materialized
+            # contiguously with shape (layer_num+1, memory_len, bs, embedding_dim) compatible with GTrXL,
+            # instead of going through a non-contiguous permute view that is copied again downstream
+            prev_mem_batch = torch.stack(prev_mem, dim=2)
+            prev_mem_target_batch = torch.stack(prev_mem_target, dim=2)
             data = timestep_collate(data)
+            # the stacked memories join the collated dict here, so they are pinned and shipped
+            # asynchronously on the same side stream as the obs tensors below; the wait_stream
+            # after the copy guarantees they are resident before reset_memory consumes them
             data['prev_memory_batch'] = prev_mem_batch
             data['prev_memory_target_batch'] = prev_mem_target_batch
         else:
             data = timestep_collate(data)
         if self._cuda:
-            data = to_device(data, self._device)
+            # Pin the collated host batch and issue its H2D copy on a dedicated stream,
+            # so the transfer of the large (T, B, ...) obs tensors can overlap the
+            # remaining host-side preprocessing; the compute stream only waits on the
+            # copy itself.
+            data = self._pin_data(data)
+            with torch.cuda.stream(self._h2d_stream):
+                data = to_device(data, self._device, non_blocking=True)
+            torch.cuda.current_stream().wait_stream(self._h2d_stream)
+
+        # if obs is stored as uint8 (e.g. raw Atari frames), it is transferred as-is (4x fewer
+        # bytes than float32) and only normalized to float after reaching the device
+        if isinstance(data['obs'], torch.Tensor) and data['obs'].dtype == torch.uint8:
+            data['obs'] = data['obs'].to(torch.float32).div_(255.0)
 
         if self._priority_IS_weight:
             assert self._priority, "Use IS Weight correction, but Priority is not used."
@@ -219,25 +351,22 @@ class R2D2GTrXLPolicy(Policy):
         # the q_nstep_td_error, should be length of [self._unroll_len]
         ignore_done = self._cfg.learn.ignore_done
         if ignore_done:
-            data['done'] = [None for _ in range(self._unroll_len)]
+            data['done'] = None
         else:
             data['done'] = data['done'].float()  # for computation of online model self._learn_model
             # NOTE that after the proprocessing of  get_nstep_return_data() in _get_train_sample
             # the data['done'][t] is already the n-step done
 
-        # if the data don't include 'weight' or 'value_gamma' then fill in None in a list
-        # with length of [self._unroll_len_add_burnin_step-self._burnin_step],
-        # below is two different implementation ways
+        # if the data don't include 'weight' or 'value_gamma' then a plain None sentinel is used
+        # instead of the old [None] * unroll_len list, the loss branches on it once
         if 'value_gamma' not in data:
-            data['value_gamma'] = [None for _ in range(self._unroll_len)]
-        else:
-            data['value_gamma'] = data['value_gamma']
+            data['value_gamma'] = None
 
-        if 'weight' not in data or data['weight'] is None:
-            data['weight'] = [None for _ in range(self._unroll_len)]
-        else:
-            data['weight'] = data['weight'] * torch.ones_like(data['done'])
-            # every timestep in sequence has same weight, which is the _priority_IS_weight in PER
+        if 'weight' not in data:
+            data['weight'] = None
+        # otherwise keep the (B, ) IS weight as is: every timestep in a sequence shares the same
+        # weight (the _priority_IS_weight in PER), so it is broadcast lazily in the loss instead
+        # of materializing a (unroll_len, B) tensor here every step
 
         data['action'] = data['action'][:-self._nstep]
         data['reward'] = data['reward'][:-self._nstep]
@@ -248,6 +377,56 @@ class R2D2GTrXLPolicy(Policy):
 
         return data
 
+    def _compute_loss_and_priority(
+            self,
+            q_value: torch.Tensor,
+            target_q_value: torch.Tensor,
+            action: torch.Tensor,
+            target_q_action: torch.Tensor,
+            reward: torch.Tensor,
+            done: Optional[torch.Tensor],
+            weight: Optional[torch.Tensor],
+            value_gamma: Optional[torch.Tensor],
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        r"""
+        Overview:
+            Pure-tensor tail of ``_forward_learn``: compute the nstep TD loss over the whole \
+            unroll and the per-sequence priority. Factored out so it can optionally be fused \
+            with ``torch.compile`` (config flag ``learn.compile_loss``).
+        """
+        # Fold the time dimension into the batch and compute the nstep TD error of all
+        # timesteps with one call, instead of launching one small kernel per timestep.
+        # The first 'burnin_step' steps are skipped because we only needed them to
+        # initialize the memory, and the last 'nstep' steps because we don't have their
+        # target obs. ``done``/``weight``/``value_gamma`` are None when unused.
+        begin, end = self._burnin_step, self._unroll_len - self._nstep
+        tlen, bs = end - begin, q_value.shape[1]
+        td_data = q_nstep_td_data(
+            q_value[begin:end].reshape(tlen * bs, -1),
+            target_q_value[begin:end].reshape(tlen * bs, -1),
+            action[begin:end].reshape(tlen * bs),
+            target_q_action[begin:end].reshape(tlen * bs),
+            # go straight from the collated (T, B, nstep) layout to (nstep, T*B): one permute
+            # view plus the reshape copy, with no intermediate contiguous (T, nstep, B) tensor
+            reward[begin:end].permute(2, 0, 1).reshape(self._nstep, tlen * bs),
+            None if done is None else done[begin:end].reshape(tlen * bs),
+            # (B, ) IS weight shared by all timesteps of a sequence, broadcast to (T*B, )
+            None if weight is None else weight.expand(tlen, bs).reshape(tlen * bs),
+        )
+        value_gamma = None if value_gamma is None else value_gamma[begin:end].reshape(tlen * bs)
+        # The loss comes back as one mean over all T*B entries, so autograd records a
+        # single reduction node instead of the T-long chain of adds the old per-step
+        # accumulation produced.
+        if self._value_rescale:
+            loss, td_error = q_nstep_td_error_with_rescale(td_data, self._gamma, self._nstep, value_gamma=value_gamma)
+        else:
+            loss, td_error = q_nstep_td_error(td_data, self._gamma, self._nstep, value_gamma=value_gamma)
+        td_error = td_error.abs().view(tlen, bs)
+
+        # using the mixture of max and mean absolute n-step TD-errors as the priority of the sequence
+        td_error_per_sample = 0.9 * td_error.amax(dim=0) + 0.1 * td_error.mean(dim=0)
+        return loss, td_error_per_sample
+
     def _forward_learn(self, data: dict) -> Dict[str, Any]:
         r"""
         Overview:
@@ -269,47 +448,48 @@ class R2D2GTrXLPolicy(Policy):
             self._learn_model.reset_memory(state=data['prev_memory_batch'])
             self._target_model.reset_memory(state=data['prev_memory_target_batch'])
         elif self._init_memory == 'zero':
-            # use the zero-initialized state memory
-            self._learn_model.reset_memory()
-            self._target_model.reset_memory()
+            # use the zero-initialized state memory; the zero state is allocated once and shared
+            # by all resets of a train step, which is safe because GTrXL's Memory rebinds its
+            # tensor on update instead of writing into it
+            bs = data['main_obs'].shape[1]
+            if self._zero_memory is None or self._zero_memory.shape[2] != bs:
+                self._learn_model.reset_memory(batch_size=bs)
+                self._zero_memory = self._learn_model.get_memory()
+            else:
+                self._learn_model.reset_memory(state=self._zero_memory)
+            self._target_model.reset_memory(state=self._zero_memory)
 
         inputs = data['main_obs']
         q_value = self._learn_model.forward(inputs)['logit']  # shape (seq_len, bs, act_dim)
         next_inputs = data['target_obs']
         with torch.no_grad():
-            target_q_value = self._target_model.forward(next_inputs)['logit']
-            if self._init_memory == 'old':
-                self._learn_model.reset_memory(state=data['prev_memory_target_batch'])
-            elif self._init_memory == 'zero':
-                self._learn_model.reset_memory()
-            target_q_action = self._learn_model.forward(next_inputs)['action']  # argmax_action double_dqn
+            if self._cuda:
+                # the target-model forward and the learn-model argmax forward (double dqn)
+                # are independent transformer passes over the same inputs, so they are
+                # issued on two streams and can run concurrently on the GPU
+                self._aux_stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(self._aux_stream):
+                    if self._init_memory == 'old':
+                        self._learn_model.reset_memory(state=data['prev_memory_target_batch'])
+                    elif self._init_memory == 'zero':
+                        self._learn_model.reset_memory(state=self._zero_memory)
+                    target_q_action = self._learn_model.forward(next_inputs)['action']  # argmax_action double_dqn
+                target_q_value = self._target_model.forward(next_inputs)['logit']
+                torch.cuda.current_stream().wait_stream(self._aux_stream)
+            else:
+                target_q_value = self._target_model.forward(next_inputs)['logit']
+                if self._init_memory == 'old':
+                    self._learn_model.reset_memory(state=data['prev_memory_target_batch'])
+                elif self._init_memory == 'zero':
+                    self._learn_model.reset_memory(state=self._zero_memory)
+                target_q_action = self._learn_model.forward(next_inputs)['action']  # argmax_action double_dqn
 
         action, reward, done, weight = data['action'], data['reward'], data['done'], data['weight']
         value_gamma = data['value_gamma']
-        # T, B, nstep -> T, nstep, B
-        reward = reward.permute(0, 2, 1).contiguous()
-        loss = []
-        td_error = []
-        for t in range(self._burnin_step, self._unroll_len - self._nstep):
-            # here skip the first 'burnin_step' steps because we only needed that to initialize the memory, and
-            # skip the last 'nstep' steps because we don't have their target obs
-            td_data = q_nstep_td_data(
-                q_value[t], target_q_value[t], action[t], target_q_action[t], reward[t], done[t], weight[t]
-            )
-            if self._value_rescale:
-                l, e = q_nstep_td_error_with_rescale(td_data, self._gamma, self._nstep, value_gamma=value_gamma[t])
-            else:
-                l, e = q_nstep_td_error(td_data, self._gamma, self._nstep, value_gamma=value_gamma[t])
-            loss.append(l)
-            td_error.append(e.abs())
-        loss = sum(loss) / (len(loss) + 1e-8)
-
-        # using the mixture of max and mean absolute n-step TD-errors as the priority of the sequence
-        td_error_per_sample = 0.9 * torch.max(
-            torch.stack(td_error), dim=0
-        )[0] + (1 - 0.9) * (torch.sum(torch.stack(td_error), dim=0) / (len(td_error) + 1e-8))
-        # td_error shape list(<self._unroll_len_add_burnin_step-self._burnin_step-self._nstep>, B), for example, (75,64)
-        # torch.sum(torch.stack(td_error), dim=0) can also be replaced with sum(td_error)
+        bs = q_value.shape[1]
+        loss, td_error_per_sample = self._compute_loss_and_priority(
+            q_value, target_q_value, action, target_q_action, reward, done, weight, value_gamma
+        )
 
         # update
         self._optimizer.zero_grad()
@@ -319,7 +499,10 @@ class R2D2GTrXLPolicy(Policy):
         self._target_model.update(self._learn_model.state_dict())
 
         # the information for debug
-        batch_range = torch.arange(action[0].shape[0])
+        batch_range = self._batch_range_cache.get(bs)
+        if batch_range is None:
+            batch_range = torch.arange(bs, device=q_value.device)
+            self._batch_range_cache[bs] = batch_range
         q_s_a_t0 = q_value[0][batch_range, action[0]]
         target_q_s_a_t0 = target_q_value[0][batch_range, target_q_action[0]]
 
@@ -383,16 +566,15 @@ class R2D2GTrXLPolicy(Policy):
             - necessary: ``action``
         """
         data_id = list(data.keys())
-        data = default_collate(list(data.values()))
-        if self._cuda:
-            data = to_device(data, self._device)
+        data = self._fast_collate(list(data.values()))
         self._collect_model.eval()
-        with torch.no_grad():
+        # inference_mode also skips the autograd version-counter bookkeeping no_grad still pays
+        with torch.inference_mode():
             output = self._collect_model.forward(data, eps=eps, data_id=data_id)
         del output['input_seq']
         if self._cuda:
             output = to_device(output, 'cpu')
-        output = default_decollate(output)
+        output = self._fast_decollate(output)
         return {i: d for i, d in zip(data_id, output)}
 
     def _reset_collect(self, data_id: Optional[List[int]] = None) -> None:
@@ -460,15 +642,13 @@ class R2D2GTrXLPolicy(Policy):
             - necessary: ``action``
         """
         data_id = list(data.keys())
-        data = default_collate(list(data.values()))
-        if self._cuda:
-            data = to_device(data, self._device)
+        data = self._fast_collate(list(data.values()))
         self._eval_model.eval()
-        with torch.no_grad():
+        with torch.inference_mode():
             output = self._eval_model.forward(data, data_id=data_id)
         if self._cuda:
             output = to_device(output, 'cpu')
-        output = default_decollate(output)
+        output = self._fast_decollate(output)
         return {i: d for i, d in zip(data_id, output)}
 
     def _reset_eval(self, data_id: Optional[List[int]] = None) -> None:
@@ -7,7 +7,7 @@ import torch.nn as nn
 import torch.nn.functional as F
 from torch.distributions import Normal, Independent
 
-from ding.torch_utils import Adam, to_device
+from ding.torch_utils import Adam, to_device, to_device_async
 from ding.rl_utils import v_1step_td_data, v_1step_td_error, get_train_sample, q_v_1step_td_error, q_v_1step_td_data
 from ding.model import model_wrap
 from ding.utils import POLICY_REGISTRY
@@ -200,6 +200,8 @@ class SACDiscretePolicy(Policy):
         # Init
         self._priority = self._cfg.priority
         self._priority_IS_weight = self._cfg.priority_IS_weight
+        # cache the per-iteration config reads, EasyDict attribute access is a python fallback
+        self._ignore_done = self._cfg.learn.ignore_done
         # self._value_network = False  # TODO self._cfg.model.value_network
         self._twin_critic = self._cfg.model.twin_critic
 
@@ -264,12 +266,13 @@ class SACDiscretePolicy(Policy):
         data = default_preprocess_learn(
             data,
             use_priority=self._priority,
-            use_priority_IS_weight=self._cfg.priority_IS_weight,
-            ignore_done=self._cfg.learn.ignore_done,
+            use_priority_IS_weight=self._priority_IS_weight,
+            ignore_done=self._ignore_done,
             use_nstep=False
         )
         if self._cuda:
-            data = to_device(data, self._device)
+            # pinned + overlapped H2D copy, the transfer runs on a dedicated stream
+            data = to_device_async(data, self._device)
 
         self._learn_model.train()
         self._target_model.train()
@@ -714,8 +717,12 @@ class SACPolicy(Policy):
         # Init
         self._priority = self._cfg.priority
         self._priority_IS_weight = self._cfg.priority_IS_weight
+        # cache the per-iteration config reads, EasyDict attribute access is a python fallback
+        self._ignore_done = self._cfg.learn.ignore_done
         self._value_network = False  # TODO self._cfg.model.value_network
         self._twin_critic = self._cfg.model.twin_critic
+        # learn.amp_dtype='bf16' runs the learn-mode model forward under bf16 autocast
+        self._amp_enabled = self._cuda and self._cfg.learn.get('amp_dtype', None) == 'bf16'
 
         # Weight Init for the last output layer
         init_w = self._cfg.learn.init_w
@@ -791,12 +798,13 @@ class SACPolicy(Policy):
         data = default_preprocess_learn(
             data,
             use_priority=self._priority,
-            use_priority_IS_weight=self._cfg.priority_IS_weight,
-            ignore_done=self._cfg.learn.ignore_done,
+            use_priority_IS_weight=self._priority_IS_weight,
+            ignore_done=self._ignore_done,
             use_nstep=False
         )
         if self._cuda:
-            data = to_device(data, self._device)
+            # pinned + overlapped H2D copy, the transfer runs on a dedicated stream
+            data = to_device_async(data, self._device)
 
         self._learn_model.train()
         self._target_model.train()
@@ -806,17 +814,19 @@ class SACPolicy(Policy):
         done = data['done']
 
         # 1. predict q value
-        q_value = self._learn_model.forward(data, mode='compute_critic')['q_value']
+        with self._amp_context():
+            q_value = self._learn_model.forward(data, mode='compute_critic')['q_value']
 
         # 2. predict target value depend self._value_network.
         if self._value_network:
-            v_value = self._learn_model.forward(obs, mode='compute_value_critic')['v_value']
-            with torch.no_grad():
+            with self._amp_context():
+                v_value = self._learn_model.forward(obs, mode='compute_value_critic')['v_value']
+            with torch.no_grad(), self._amp_context():
                 next_v_value = self._target_model.forward(next_obs, mode='compute_value_critic')['v_value']
             target_q_value = next_v_value
         else:
             # target q value.
-            with torch.no_grad():
+            with torch.no_grad(), self._amp_context():
                 (mu, sigma) = self._learn_model.forward(next_obs, mode='compute_actor')['logit']
 
                 dist = Independent(Normal(mu, sigma), 1)
@@ -856,7 +866,8 @@ class SACPolicy(Policy):
         self._optimizer_q.step()
 
         # 5. evaluate to get action distribution
-        (mu, sigma) = self._learn_model.forward(data['obs'], mode='compute_actor')['logit']
+        with self._amp_context():
+            (mu, sigma) = self._learn_model.forward(data['obs'], mode='compute_actor')['logit']
         dist = Independent(Normal(mu, sigma), 1)
         pred = dist.rsample()
         action = torch.tanh(pred)
@@ -866,7 +877,8 @@ class SACPolicy(Policy):
         log_prob = log_prob - torch.log(y).sum(-1, keepdim=True)
 
         eval_data = {'obs': obs, 'action': action}
-        new_q_value = self._learn_model.forward(eval_data, mode='compute_critic')['q_value']
+        with self._amp_context():
+            new_q_value = self._learn_model.forward(eval_data, mode='compute_critic')['q_value']
         if self._twin_critic:
             new_q_value = torch.min(new_q_value[0], new_q_value[1])
 
@@ -1271,6 +1283,8 @@ class SQILSACPolicy(SACPolicy):
         # Init
         self._priority = self._cfg.priority
         self._priority_IS_weight = self._cfg.priority_IS_weight
+        # cache the per-iteration config reads, EasyDict attribute access is a python fallback
+        self._ignore_done = self._cfg.learn.ignore_done
         self._value_network = False  # TODO self._cfg.model.value_network
         self._twin_critic = self._cfg.model.twin_critic
 
@@ -1352,16 +1366,16 @@ class SQILSACPolicy(SACPolicy):
             agent_data = default_preprocess_learn(
                 data[0:len(data) // 2],
                 use_priority=self._priority,
-                use_priority_IS_weight=self._cfg.priority_IS_weight,
-                ignore_done=self._cfg.learn.ignore_done,
+                use_priority_IS_weight=self._priority_IS_weight,
+                ignore_done=self._ignore_done,
                 use_nstep=False
             )
 
             expert_data = default_preprocess_learn(
                 data[len(data) // 2:],
                 use_priority=self._priority,
-                use_priority_IS_weight=self._cfg.priority_IS_weight,
-                ignore_done=self._cfg.learn.ignore_done,
+                use_priority_IS_weight=self._priority_IS_weight,
+                ignore_done=self._ignore_done,
                 use_nstep=False
             )
             if self._cuda:
@@ -1371,8 +1385,8 @@ class SQILSACPolicy(SACPolicy):
         data = default_preprocess_learn(
             data,
             use_priority=self._priority,
-            use_priority_IS_weight=self._cfg.priority_IS_weight,
-            ignore_done=self._cfg.learn.ignore_done,
+            use_priority_IS_weight=self._priority_IS_weight,
+            ignore_done=self._ignore_done,
             use_nstep=False
         )
         if self._cuda:
@@ -11,7 +11,7 @@ from easydict import EasyDict
 
 from ding.model import FCEncoder, ConvEncoder
 from ding.utils import RunningMeanStd
-from ding.utils import SequenceType, REWARD_MODEL_REGISTRY
+from ding.utils import SequenceType, REWARD_MODEL_REGISTRY, one_time_warning
 from .base_reward_model import BaseRewardModel
 
 
@@ -108,6 +108,9 @@ class RndNGURewardModel(BaseRewardModel):
         batch_size=64,
         hidden_size_list=[64, 64, 128],
         update_per_collect=100,
+        # (bool) whether to capture the fixed-shape train step in a CUDA graph and replay it,
+        # which turns the per-iteration kernel launches into a single graph launch
+        cuda_graph=False,
     )
 
     def __init__(self, config: EasyDict, device: str, tb_logger: 'SummaryWriter') -> None:  # noqa
@@ -122,7 +125,22 @@ class RndNGURewardModel(BaseRewardModel):
         assert self.intrinsic_reward_type in ['add', 'new', 'assign']
         self.train_data_total = []
         self.train_data = []
-        self.opt = optim.Adam(self.reward_model.predictor.parameters(), config.learning_rate)
+        self._use_cuda_graph = config.get('cuda_graph', False) and device.startswith("cuda") \
+            and hasattr(torch.cuda, 'CUDAGraph')
+        if self._use_cuda_graph:
+            try:
+                # capturable Adam keeps its step/beta state on device so opt.step() can be captured
+                self.opt = optim.Adam(
+                    self.reward_model.predictor.parameters(), config.learning_rate, capturable=True
+                )
+            except TypeError:
+                one_time_warning("capturable Adam needs torch>=1.12, fall back to the eager train step")
+                self._use_cuda_graph = False
+                self.opt = optim.Adam(self.reward_model.predictor.parameters(), config.learning_rate)
+        else:
+            self.opt = optim.Adam(self.reward_model.predictor.parameters(), config.learning_rate)
+        self._train_graph = None
+        self._graph_warmup_cnt = 0
         self.estimate_cnt_rnd = 0
         self._running_mean_std_rnd = RunningMeanStd(epsilon=1e-4)
         self.only_use_last_five_frames = config.only_use_last_five_frames_for_icm_rnd
@@ -131,13 +149,49 @@ class RndNGURewardModel(BaseRewardModel):
         train_data: list = random.sample(list(self.train_data_cur), self.cfg.batch_size)
 
         train_data: torch.Tensor = torch.stack(train_data).to(self.device)
+        if train_data.dtype == torch.uint8:
+            # uint8 frames from the env (scale=False), normalize on device
+            train_data = train_data.float().div_(255.)
+
+        if self._use_cuda_graph:
+            self._train_step_graphed(train_data)
+        else:
+            self._train_step(train_data)
 
+    def _train_step(self, train_data: torch.Tensor) -> None:
         predict_feature, target_feature = self.reward_model(train_data)
         loss = F.mse_loss(predict_feature, target_feature.detach())
         self.opt.zero_grad()
         loss.backward()
         self.opt.step()
 
+    def _train_step_graphed(self, train_data: torch.Tensor) -> None:
+        # batch_size and obs_shape are fixed, so the forward/backward/step kernel sequence is
+        # identical every iteration and can be captured once, then replayed with one launch
+        if self._train_graph is None:
+            if self._graph_warmup_cnt < 3:
+                # warmup iterations must run on a side stream before capture
+                if self._graph_warmup_cnt == 0:
+                    self._graph_stream = torch.cuda.Stream()
+                self._graph_stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(self._graph_stream):
+                    self._train_step(train_data)
+                torch.cuda.current_stream().wait_stream(self._graph_stream)
+                self._graph_warmup_cnt += 1
+                return
+            self._static_input = train_data.clone()
+            self._train_graph = torch.cuda.CUDAGraph()
+            self.opt.zero_grad(set_to_none=False)
+            with torch.cuda.graph(self._train_graph):
+                predict_feature, target_feature = self.reward_model(self._static_input)
+                loss = F.mse_loss(predict_feature, target_feature.detach())
+                loss.backward()
+                self.opt.step()
+                self.opt.zero_grad(set_to_none=False)
+        else:
+            self._static_input.copy_(train_data)
+        self._train_graph.replay()
+
     def train(self) -> None:
         if self.only_use_last_five_frames:
             # self.train_obs shape list(list) [batch_size,seq_length,N
@@ -178,6 +232,8 @@ class RndNGURewardModel(BaseRewardModel):
             obs = sum(obs, [])
 
         obs = torch.stack(obs).to(self.device)
+        if obs.dtype == torch.uint8:
+            obs = obs.float().div_(255.)
 
         with torch.no_grad():
             predict_feature, target_feature = self.reward_model(obs)
@@ -256,6 +312,9 @@ class EpisodicNGURewardModel(BaseRewardModel):
         batch_size=64,
         hidden_size_list=[64, 64, 128],
         update_per_collect=100,
+        # (bool) whether to capture the fixed-shape train step in a CUDA graph and replay it,
+        # which turns the per-iteration kernel launches into a single graph launch
+        cuda_graph=False,
         # means if using rescale trick to the last non-zero reward
         # when combing extrinsic and intrinsic reward.
         # the rescale trick only used in:
@@ -281,7 +340,20 @@ class EpisodicNGURewardModel(BaseRewardModel):
         assert self.intrinsic_reward_type in ['add', 'new', 'assign']
         self.train_obs_total = []
         self.train_action_total = []
-        self.opt = optim.Adam(self.episodic_reward_model.parameters(), config.learning_rate)
+        self._use_cuda_graph = config.get('cuda_graph', False) and device.startswith("cuda") \
+            and hasattr(torch.cuda, 'CUDAGraph')
+        if self._use_cuda_graph:
+            try:
+                # capturable Adam keeps its step/beta state on device so opt.step() can be captured
+                self.opt = optim.Adam(self.episodic_reward_model.parameters(), config.learning_rate, capturable=True)
+            except TypeError:
+                one_time_warning("capturable Adam needs torch>=1.12, fall back to the eager train step")
+                self._use_cuda_graph = False
+                self.opt = optim.Adam(self.episodic_reward_model.parameters(), config.learning_rate)
+        else:
+            self.opt = optim.Adam(self.episodic_reward_model.parameters(), config.learning_rate)
+        self._train_graph = None
+        self._graph_warmup_cnt = 0
         self.estimate_cnt_episodic = 0
         self._running_mean_std_episodic_dist = RunningMeanStd(epsilon=1e-4)
         self._running_mean_std_episodic_reward = RunningMeanStd(epsilon=1e-4)
@@ -294,7 +366,17 @@ class EpisodicNGURewardModel(BaseRewardModel):
         train_obs: torch.Tensor = self.train_obs[train_index].to(self.device)  # shape (self.cfg.batch_size, obs_dim)
         train_next_obs: torch.Tensor = self.train_next_obs[train_index].to(self.device)
         train_action: torch.Tensor = self.train_action[train_index].to(self.device)
+        if train_obs.dtype == torch.uint8:
+            # uint8 frames from the env (scale=False), normalize on device
+            train_obs = train_obs.float().div_(255.)
+            train_next_obs = train_next_obs.float().div_(255.)
+
+        if self._use_cuda_graph:
+            self._train_step_graphed(train_obs, train_next_obs, train_action)
+        else:
+            self._train_step(train_obs, train_next_obs, train_action)
 
+    def _train_step(self, train_obs: torch.Tensor, train_next_obs: torch.Tensor, train_action: torch.Tensor) -> None:
         train_data = {'obs': train_obs, 'next_obs': train_next_obs}
         pred_action_logits, pred_action_probs = self.episodic_reward_model(train_data)
 
@@ -303,6 +385,40 @@ class EpisodicNGURewardModel(BaseRewardModel):
         inverse_loss.backward()
         self.opt.step()
 
+    def _train_step_graphed(
+            self, train_obs: torch.Tensor, train_next_obs: torch.Tensor, train_action: torch.Tensor
+    ) -> None:
+        # batch_size and obs/action shapes are fixed, so the forward/backward/step kernel sequence
+        # is identical every iteration and can be captured once, then replayed with one launch
+        if self._train_graph is None:
+            if self._graph_warmup_cnt < 3:
+                # warmup iterations must run on a side stream before capture
+                if self._graph_warmup_cnt == 0:
+                    self._graph_stream = torch.cuda.Stream()
+                self._graph_stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(self._graph_stream):
+                    self._train_step(train_obs, train_next_obs, train_action)
+                torch.cuda.current_stream().wait_stream(self._graph_stream)
+                self._graph_warmup_cnt += 1
+                return
+            self._static_obs = train_obs.clone()
+            self._static_next_obs = train_next_obs.clone()
+            self._static_action = train_action.clone()
+            self._train_graph = torch.cuda.CUDAGraph()
+            self.opt.zero_grad(set_to_none=False)
+            with torch.cuda.graph(self._train_graph):
+                train_data = {'obs': self._static_obs, 'next_obs': self._static_next_obs}
+                pred_action_logits, pred_action_probs = self.episodic_reward_model(train_data)
+                inverse_loss = F.cross_entropy(pred_action_logits, self._static_action.squeeze(-1))
+                inverse_loss.backward()
+                self.opt.step()
+                self.opt.zero_grad(set_to_none=False)
+        else:
+            self._static_obs.copy_(train_obs)
+            self._static_next_obs.copy_(train_next_obs)
+            self._static_action.copy_(train_action)
+        self._train_graph.replay()
+
     def train(self) -> None:
         self.train_next_obs_total = copy.deepcopy(self.train_obs_total)
 
@@ -380,6 +496,8 @@ class EpisodicNGURewardModel(BaseRewardModel):
             obs = torch.stack(obs, dim=0).view(batch_size * seq_length, *self.cfg.obs_shape).to(self.device)
         # way 2
         # obs = torch.cat(obs, 0)
+        if obs.dtype == torch.uint8:
+            obs = obs.float().div_(255.)
 
         inputs = {'obs': obs, 'is_null': is_null}
         with torch.no_grad():
@@ -152,6 +152,7 @@ class TrexRewardModel(BaseRewardModel):
         type='trex',
         learning_rate=1e-5,
         update_per_collect=100,
+        batch_size=32,  # number of snippet pairs per gradient step
         num_trajs=0,  # number of downsampled full trajectories
         num_snippets=6000,  # number of short subtrajectories to sample
     )
@@ -288,25 +289,34 @@ class TrexRewardModel(BaseRewardModel):
         loss_criterion = nn.CrossEntropyLoss()
 
         cum_loss = 0.0
+        batch_size = self.cfg.reward_model.get('batch_size', 32)
         training_data = list(zip(training_inputs, training_outputs))
         for epoch in range(self.cfg.reward_model.update_per_collect):  # todo
             np.random.shuffle(training_data)
-            training_obs, training_labels = zip(*training_data)
-            for i in range(len(training_labels)):
-
-                # traj_i, traj_j has the same length, however, they change as i increases
-                traj_i, traj_j = training_obs[i]  # traj_i is a list of array generated by env.step
-                traj_i = np.array(traj_i)
-                traj_j = np.array(traj_j)
-                traj_i = torch.from_numpy(traj_i).float().to(device)
-                traj_j = torch.from_numpy(traj_j).float().to(device)
-
-                # training_labels[i] is a boolean integer: 0 or 1
-                labels = torch.tensor([training_labels[i]]).to(device)
+            for i, start in enumerate(range(0, len(training_data), batch_size)):
+                batch = training_data[start:start + batch_size]
+
+                # flatten the ragged snippet pairs of the batch into one frame tensor, so a
+                # single conv forward replaces the 2 * batch_size tiny per-snippet forwards,
+                # then sum the per-frame rewards back per snippet with a segment index_add
+                frames, lengths = [], []
+                for traj_i, traj_j in (pair for pair, _ in batch):
+                    # traj_i/traj_j are lists of arrays generated by env.step, with ragged lengths
+                    frames.append(np.asarray(traj_i))
+                    frames.append(np.asarray(traj_j))
+                    lengths.append(len(traj_i))
+                    lengths.append(len(traj_j))
+                frames = torch.from_numpy(np.concatenate(frames)).float().to(device)
+                seg_id = torch.repeat_interleave(torch.arange(len(lengths)), torch.tensor(lengths)).to(device)
+                # training labels are boolean integers: 0 or 1
+                labels = torch.tensor([label for _, label in batch], dtype=torch.long, device=device)
 
                 # forward + backward + zero out gradient + optimize
-                outputs, abs_rewards = self.reward_model.forward(traj_i, traj_j)
-                outputs = outputs.unsqueeze(0)
+                r, abs_r = self.reward_model.cum_return(frames, mode='batch')
+                returns = torch.zeros(len(lengths), device=device).index_add_(0, seg_id, r.squeeze(-1))
+                abs_returns = torch.zeros(len(lengths), device=device).index_add_(0, seg_id, abs_r.squeeze(-1))
+                outputs = returns.view(-1, 2)  # (batch_size, 2) logits, column order is (traj_i, traj_j)
+                abs_rewards = abs_returns.sum()
                 loss = loss_criterion(outputs, labels) + self.l1_reg * abs_rewards
                 self.opt.zero_grad()
                 loss.backward()
@@ -97,6 +97,26 @@ class Adder(object):
             return data
         fake_reward = torch.zeros(1)
         next_obs_flag = 'next_obs' in data[0]
+        T = len(data)
+        rewards = [d['reward'] for d in data]
+        if all(isinstance(r, torch.Tensor) and r.shape == (1, ) for r in rewards):
+            # vectorized fast path: one cat plus a strided window view replaces the
+            # O(T * nstep) python-level tensor concats of the generic loop below
+            padded = torch.cat(rewards + [fake_reward] * nstep)
+            windows = padded.unfold(0, nstep, 1)[:T]
+            if cum_reward:
+                gamma_pows = padded.new_tensor([gamma ** j for j in range(nstep)])
+                nstep_reward = (windows * gamma_pows).sum(1)
+            else:
+                nstep_reward = windows.clone()
+            for i in range(T):
+                if next_obs_flag:
+                    data[i]['next_obs'] = data[i + nstep]['obs'] if i < T - nstep else data[-1]['next_obs']
+                data[i]['reward'] = nstep_reward[i:i + 1] if cum_reward else nstep_reward[i]
+                data[i]['done'] = data[i + nstep - 1]['done'] if i < T - nstep else data[-1]['done']
+                if correct_terminate_gamma:
+                    data[i]['value_gamma'] = gamma ** nstep if i < T - nstep else gamma ** (T - i - 1)
+            return data
         for i in range(len(data) - nstep):
             # update keys ['next_obs', 'reward', 'done'] with their n-step value
             if next_obs_flag:
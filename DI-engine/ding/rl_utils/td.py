@@ -79,16 +79,29 @@ def view_similar(x: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
 nstep_return_data = namedtuple('nstep_return_data', ['reward', 'next_value', 'done'])
 
 
+_nstep_reward_factor_cache = {}
+
+
+def _get_nstep_reward_factor(gamma: float, nstep: int, device: torch.device) -> torch.Tensor:
+    # (1, gamma, gamma^2, ...) discount table, memoized because (gamma, nstep, device) is fixed
+    # across the training loop while this used to be rebuilt (alloc + nstep tiny writes) per call
+    key = (gamma, nstep, str(device))
+    reward_factor = _nstep_reward_factor_cache.get(key)
+    if reward_factor is None:
+        reward_factor = torch.ones(nstep).to(device)
+        for i in range(1, nstep):
+            reward_factor[i] = gamma * reward_factor[i - 1]
+        _nstep_reward_factor_cache[key] = reward_factor
+    return reward_factor
+
+
 def nstep_return(data: namedtuple, gamma: Union[float, list], nstep: int, value_gamma: Optional[torch.Tensor] = None):
     reward, next_value, done = data
     assert reward.shape[0] == nstep
     device = reward.device
 
     if isinstance(gamma, float):
-        reward_factor = torch.ones(nstep).to(device)
-        for i in range(1, nstep):
-            reward_factor[i] = gamma * reward_factor[i - 1]
-        reward_factor = view_similar(reward_factor, reward)
+        reward_factor = view_similar(_get_nstep_reward_factor(gamma, nstep, device), reward)
         return_tmp = reward.mul(reward_factor).sum(0)
         if value_gamma is None:
             return_ = return_tmp + (gamma ** nstep) * next_value * (1 - done)
@@ -1,5 +1,5 @@
 from .checkpoint_helper import build_checkpoint_helper, CountVar, auto_checkpoint
-from .data_helper import to_device, to_tensor, to_ndarray, to_list, to_dtype, same_shape, tensor_to_list, \
+from .data_helper import to_device, to_device_async, pin_memory, to_tensor, to_ndarray, to_list, to_dtype, same_shape, tensor_to_list, \
     build_log_buffer, CudaFetcher, get_tensor_data, unsqueeze, squeeze, get_null_data, get_shape0
 from .distribution import CategoricalPd, CategoricalPdPytorch
 from .metric import levenshtein_distance, hamming_distance
@@ -1,3 +1,6 @@
+import logging
+import queue
+import threading
 from typing import TYPE_CHECKING
 
 from tensorboardX import SummaryWriter
@@ -121,6 +124,73 @@ for fn_name in ready_to_parallel_fns:
     if hasattr(DistributedWriter, fn_name):
         setattr(DistributedWriter, fn_name, enable_parallel(fn_name, getattr(DistributedWriter, fn_name)))
 
+class AsyncSummaryWriter:
+    """
+    Overview:
+        A thin asynchronous proxy around ``SummaryWriter``. Frequent write calls such as
+        ``add_scalar`` enqueue the event and return immediately, while a daemon thread
+        performs the protobuf serialization and file IO, keeping them off the caller's
+        hot path. Other attributes fall through to the wrapped writer synchronously.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._writer = SummaryWriter(*args, **kwargs)
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._work, daemon=True, name='async_summary_writer')
+        self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            fn_name, args, kwargs = item
+            try:
+                getattr(self._writer, fn_name)(*args, **kwargs)
+            except Exception as e:
+                # a failed write must not kill the worker: later items would never be
+                # task_done'd and flush() (queue.join) would hang the training process
+                logging.warning("AsyncSummaryWriter {} failed: {}".format(fn_name, repr(e)))
+            finally:
+                self._queue.task_done()
+
+    def __getattr__(self, name: str):
+        return getattr(self._writer, name)
+
+    def flush(self) -> None:
+        self._queue.join()
+        self._writer.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._writer.close()
+
+
+def enable_async(fn_name):
+
+    def _async_fn(self: AsyncSummaryWriter, *args, **kwargs):
+        self._queue.put((fn_name, args, kwargs))
+
+    return _async_fn
+
+
+ready_to_async_fns = [
+    'add_scalar',
+    'add_scalars',
+    'add_histogram',
+    'add_image',
+    'add_text',
+]
+for fn_name in ready_to_async_fns:
+    if hasattr(SummaryWriter, fn_name):
+        setattr(AsyncSummaryWriter, fn_name, enable_async(fn_name))
+
 # Examples:
 #     In main, `distributed_writer.plugin(task.router, is_writer=True)`,
 #     In middleware, `distributed_writer.record()`
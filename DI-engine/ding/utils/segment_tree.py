@@ -146,6 +146,38 @@ class SumSegmentTree(SegmentTree):
             assert 0 <= prefixsum <= self.reduce() + 1e-5, prefixsum
         return _find_prefixsum_idx(self.value, self.capacity, prefixsum, self.neutral_element)
 
+    def find_prefixsum_idx_batch(self, prefixsum: np.ndarray, trust_caller: bool = True) -> np.ndarray:
+        """
+        Overview:
+            Vectorized version of ``find_prefixsum_idx``: all the queries descend the tree together,
+            one level per iteration, instead of one python-level traversal per query.
+        Arguments:
+            - prefixsum (:obj:`np.ndarray`): The target prefixsums with shape :math:`(B, )`.
+            - trust_caller (:obj:`bool`): Whether to trust caller, which means whether to check whether \
+                this tree's sum is greater than the input ``prefixsum`` by calling ``reduce`` function.
+                Default set to True.
+        Returns:
+            - idx (:obj:`np.ndarray`): Eligible indices with shape :math:`(B, )`.
+        """
+        if not trust_caller:
+            s = self.reduce()
+            assert np.all(prefixsum >= 0) and np.all(prefixsum <= s + 1e-5), prefixsum
+        remain = np.asarray(prefixsum, dtype=np.float64).copy()
+        idx = np.ones(remain.shape[0], dtype=np.int64)  # start from root node
+        while idx[0] < self.capacity:  # all queries are at the same depth
+            left = self.value[2 * idx]
+            # mirror the scalar descent: go left iff tree[2 * idx] > prefixsum
+            go_right = left <= remain
+            remain -= np.where(go_right, left, 0.)
+            idx = 2 * idx + go_right
+        leaf = idx - self.capacity
+        # rare neutral-element corner case (query equal to the total sum), resolve with the scalar routine
+        bad = self.value[idx] == self.neutral_element
+        if np.any(bad):
+            for i in np.nonzero(bad)[0]:
+                leaf[i] = self.find_prefixsum_idx(float(np.asarray(prefixsum)[i]))
+        return leaf
+
 
 class MinSegmentTree(SegmentTree):
 
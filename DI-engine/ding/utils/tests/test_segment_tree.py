@@ -58,6 +58,24 @@ class TestSumSegmentTree:
         assert (tree.find_prefixsum_idx(0.8) == 6)
         assert (tree.find_prefixsum_idx(tree.reduce()) == 6)
 
+    def test_find_prefixsum_idx_batch(self):
+        tree = SumSegmentTree(capacity=8)
+        elements = [0, 0.1, 0.5, 0, 0, 0.2, 0.8, 0]
+        for idx, val in enumerate(elements):
+            tree[idx] = val
+        with pytest.raises(AssertionError):
+            tree.find_prefixsum_idx_batch(np.array([0., tree.reduce() + 1e-4]), trust_caller=False)
+
+        prefixsum = np.array([0, 0.09, 0.1, 0.59, 0.6, 0.799, 0.8, tree.reduce()])
+        scalar_result = [tree.find_prefixsum_idx(p) for p in prefixsum]
+        batch_result = tree.find_prefixsum_idx_batch(prefixsum)
+        assert (batch_result.tolist() == scalar_result)
+
+        prefixsum = np.random.uniform(0, tree.reduce(), size=(128, ))
+        scalar_result = [tree.find_prefixsum_idx(p) for p in prefixsum]
+        batch_result = tree.find_prefixsum_idx_batch(prefixsum)
+        assert (batch_result.tolist() == scalar_result)
+
 
 @pytest.mark.unittest
 class TestMinSegmentTree:
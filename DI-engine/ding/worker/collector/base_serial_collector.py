@@ -215,8 +215,8 @@ def to_tensor_transitions(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if 'next_obs' not in data[0]:
         return to_tensor(data, transform_scalar=False)
     else:
-        # for save memory of next_obs
-        data = to_tensor(data, transform_scalar=False)
+        # for save memory of next_obs: walk the transitions once with next_obs left untouched,
+        # then share the following transition's obs tensor instead of converting T copies
         data = to_tensor(data, ignore_keys=['next_obs'], transform_scalar=False)
         for i in range(len(data) - 1):
             data[i]['next_obs'] = data[i + 1]['obs']
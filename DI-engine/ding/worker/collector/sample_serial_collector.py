@@ -52,6 +52,10 @@ class SampleSerialCollector(ISerialCollector):
         self._cfg = cfg
         self._timer = EasyTimer()
         self._end_flag = False
+        # per-env level seed actually in effect (PLR); lazily initialized on the first
+        # collect call that passes level_seeds and persists across collect calls, since
+        # envs keep playing their current level over iteration boundaries
+        self._active_level_seeds = None
 
         if tb_logger is not None:
             self._logger, _ = build_logger(
@@ -227,6 +231,10 @@ class SampleSerialCollector(ISerialCollector):
             )
         if policy_kwargs is None:
             policy_kwargs = {}
+        if level_seeds is not None and self._active_level_seeds is None:
+            # the entry seeds and resets every env with the first seed batch before the
+            # main loop, so on the first collect the queued seeds are the applied ones
+            self._active_level_seeds = [level_seeds[i] for i in range(self._env_num)]
         collected_sample = 0
         return_data = []
 
@@ -257,6 +265,9 @@ class SampleSerialCollector(ISerialCollector):
                         self._env.reset({env_id: None})
                         self._policy.reset([env_id])
                         self._reset_stat(env_id)
+                        if level_seeds is not None:
+                            # the manual reset applies the seed queued at the manager
+                            self._active_level_seeds[env_id] = level_seeds[env_id]
                         self._logger.info('Env{} returns a abnormal step, its info is {}'.format(env_id, timestep.info))
                         continue
                     if 'type' in self._policy.get_attribute('cfg') and \
@@ -270,7 +281,10 @@ class SampleSerialCollector(ISerialCollector):
                             self._obs_pool[env_id], self._policy_output_pool[env_id], timestep
                         )
                         if level_seeds is not None:
-                            transition['seed'] = level_seeds[env_id]
+                            # tag with the seed the env is actually playing: envs reseed
+                            # lazily at auto-reset, so the queued level_seeds[env_id] only
+                            # takes effect once this env's current episode finishes
+                            transition['seed'] = self._active_level_seeds[env_id]
                     # ``train_iter`` passed in from ``serial_entry``, indicates current collecting model's iteration.
                     transition['collect_iter'] = train_iter
                     self._traj_buffer[env_id].append(transition)
@@ -313,6 +327,10 @@ class SampleSerialCollector(ISerialCollector):
                     # Env reset is done by env_manager automatically
                     self._policy.reset([env_id])
                     self._reset_stat(env_id)
+                    if level_seeds is not None:
+                        # the auto-reset picks up the seed queued at the manager, so the
+                        # next transitions of this env belong to the new level
+                        self._active_level_seeds[env_id] = level_seeds[env_id]
         # log
         self._output_log(train_iter)
         # on-policy reset
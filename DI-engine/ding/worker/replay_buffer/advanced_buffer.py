@@ -3,6 +3,7 @@ import copy
 import time
 from typing import Union, NoReturn, Any, Optional, List, Dict, Tuple
 import numpy as np
+import torch
 import hickle
 
 from ding.worker.replay_buffer import IBuffer
@@ -19,6 +20,26 @@ def to_positive_index(idx: Union[int, None], size: int) -> int:
         return size + idx
 
 
+def cast_float_data(item: Any, dtype: str) -> Any:
+    """
+    Overview:
+        Recursively cast the float parts of ``item`` (tensor, ndarray, or dict/list/tuple of them)
+        to ``dtype`` ('float16' or 'float32'). Integer and bool parts are returned untouched, so
+        action masks and indices keep their exact values. Sequences matter for unrolled samples:
+        ``Adder.get_train_sample`` + ``lists_to_dicts`` produce obs dicts whose values are Python
+        lists of per-timestep tensors.
+    """
+    if isinstance(item, dict):
+        return {k: cast_float_data(v, dtype) for k, v in item.items()}
+    if isinstance(item, list) or isinstance(item, tuple):
+        return [cast_float_data(t, dtype) for t in item]
+    if isinstance(item, torch.Tensor) and item.dtype in (torch.float32, torch.float16):
+        return item.to(getattr(torch, dtype))
+    if isinstance(item, np.ndarray) and item.dtype in (np.float32, np.float16):
+        return item.astype(getattr(np, dtype), copy=False)
+    return item
+
+
 @BUFFER_REGISTRY.register('advanced')
 class AdvancedReplayBuffer(IBuffer):
     r"""
@@ -55,6 +76,10 @@ class AdvancedReplayBuffer(IBuffer):
         enable_track_used_data=False,
         # Whether to deepcopy data when willing to insert and sample data. For security purpose.
         deepcopy=False,
+        # (str or None) If set to 'float16', the float parts of obs/next_obs are stored in half
+        # precision, halving buffer memory and sample-time bandwidth; sampled batches are cast
+        # back to float32 before they reach the learner. Integer/bool parts are never touched.
+        store_dtype=None,
         thruput_controller=dict(
             # Rate limit. The ratio of "Sample Count" to "Push Count" should be in [min, max] range.
             # If greater than max ratio, return `None` when calling ``sample```;
@@ -108,6 +133,7 @@ class AdvancedReplayBuffer(IBuffer):
         self._cfg = cfg
         self._replay_buffer_size = self._cfg.replay_buffer_size
         self._deepcopy = self._cfg.deepcopy
+        self._store_dtype = self._cfg.get('store_dtype', None)
         # ``_data`` is a circular queue to store data (full data or meta data)
         self._data = [None for _ in range(self._replay_buffer_size)]
         # Current valid data count, indicating how many elements in ``self._data`` is valid.
@@ -261,6 +287,7 @@ class AdvancedReplayBuffer(IBuffer):
                             tmp.append(j)
                     for j in tmp:
                         result[j] = copy.deepcopy(result[j])
+            result = [self._decompress_data(d) for d in result]
             self._monitor_update_of_sample(result, cur_learner_iter)
             return result
 
@@ -340,6 +367,24 @@ class AdvancedReplayBuffer(IBuffer):
                 str_info += "Can sample."
                 return True, str_info
 
+    def _compress_data(self, data: dict) -> dict:
+        # downcast the float obs parts to the storage dtype before the data enters the queue
+        if self._store_dtype is not None:
+            for k in ('obs', 'next_obs'):
+                if k in data:
+                    data[k] = cast_float_data(data[k], self._store_dtype)
+        return data
+
+    def _decompress_data(self, data: dict) -> dict:
+        # cast the float obs parts back to float32; a shallow copy keeps the stored item intact
+        if self._store_dtype is None:
+            return data
+        data = copy.copy(data)
+        for k in ('obs', 'next_obs'):
+            if k in data:
+                data[k] = cast_float_data(data[k], 'float32')
+        return data
+
     def _append(self, ori_data: Any, cur_collector_envstep: int = -1) -> None:
         r"""
         Overview:
@@ -364,6 +409,7 @@ class AdvancedReplayBuffer(IBuffer):
                 # If data check fails, log it and return without any operations.
                 self._logger.info('Illegal data type [{}], reject it...'.format(type(data)))
                 return
+            data = self._compress_data(data)
             self._push_count += 1
             # remove->set weight->set data
             if self._data[self._tail] is not None:
@@ -395,7 +441,7 @@ class AdvancedReplayBuffer(IBuffer):
                 data = ori_data
             check_result = [self._data_check(d) for d in data]
             # Only keep data items that pass ``_data_check`.
-            valid_data = [d for d, flag in zip(data, check_result) if flag]
+            valid_data = [self._compress_data(d) for d, flag in zip(data, check_result) if flag]
             length = len(valid_data)
             # When updating ``_data`` and ``_use_count``, should consider two cases regarding
             # the relationship between "tail + data length" and "queue max length" to check whether
@@ -542,8 +588,8 @@ class AdvancedReplayBuffer(IBuffer):
             a = self._sum_tree.reduce(0, start)
             b = self._sum_tree.reduce(0, end)
             mass = mass * (b - a) + a
-        # Find prefix sum index to sample with probability
-        return [self._sum_tree.find_prefixsum_idx(m) for m in mass]
+        # Find prefix sum index to sample with probability, all queries descend the tree in one batch
+        return self._sum_tree.find_prefixsum_idx_batch(mass).tolist()
 
     def _remove(self, idx: int, use_too_many_times: bool = False) -> None:
         r"""
@@ -2,6 +2,7 @@ import copy
 from collections import defaultdict
 import numpy as np
 import pytest
+import torch
 from easydict import EasyDict
 import os
 import pickle
@@ -163,6 +164,44 @@ class TestAdvancedBuffer:
         batch = advanced_buffer.sample(10, 0, sample_range=slice(-20, -2))
         assert len(batch) == 10
 
+    def test_store_dtype(self):
+        buffer_cfg = deep_merge_dicts(
+            AdvancedReplayBuffer.default_config(), EasyDict(dict(replay_buffer_size=64, store_dtype='float16'))
+        )
+        advanced_buffer = AdvancedReplayBuffer(buffer_cfg, tb_logger=None, instance_name='test')
+        data = generate_data()
+        data['obs'] = {
+            'agent_state': np.random.randn(4).astype(np.float32),
+            'action_mask': np.ones(4, dtype=np.int64),
+        }
+        advanced_buffer.push(data, 0)
+        stored = advanced_buffer._data[0]
+        assert stored['obs']['agent_state'].dtype == np.float16
+        assert stored['obs']['action_mask'].dtype == np.int64
+        batch = advanced_buffer.sample(1, 0)
+        assert batch[0]['obs']['agent_state'].dtype == np.float32
+        assert batch[0]['obs']['action_mask'].dtype == np.int64
+        # the stored item itself must stay in half precision after sampling
+        assert stored['obs']['agent_state'].dtype == np.float16
+        # unrolled samples (Adder.get_train_sample + lists_to_dicts) store obs as
+        # dicts of per-timestep lists, which must be cast element-wise as well
+        unroll_len = 5
+        unrolled = generate_data()
+        unrolled['obs'] = {
+            'agent_state': [torch.randn(4) for _ in range(unroll_len)],
+            'action_mask': [torch.ones(4, dtype=torch.int64) for _ in range(unroll_len)],
+        }
+        advanced_buffer.push(unrolled, 0)
+        stored = advanced_buffer._data[1]
+        assert all(t.dtype == torch.float16 for t in stored['obs']['agent_state'])
+        assert all(t.dtype == torch.int64 for t in stored['obs']['action_mask'])
+        batch = advanced_buffer.sample(2, 0)
+        for sampled in batch:
+            if isinstance(sampled['obs']['agent_state'], list):
+                assert all(t.dtype == torch.float32 for t in sampled['obs']['agent_state'])
+                assert all(t.dtype == torch.int64 for t in sampled['obs']['action_mask'])
+        assert all(t.dtype == torch.float16 for t in stored['obs']['agent_state'])
+
     def test_head_tail(self):
         buffer_cfg = deep_merge_dicts(
             AdvancedReplayBuffer.default_config(), EasyDict(dict(replay_buffer_size=64, max_use=4))
@@ -21,6 +21,9 @@ pitfall_ppo_rnd_config = dict(
         obs_plus_prev_action_reward=True,  # use specific env wrapper for ngu policy
         stop_value=int(1e5),
         frame_stack=4,
+        # keep frames as uint8 in the replay buffer (4x less memory and H2D traffic),
+        # the policy and the reward models normalize by 255 on device
+        scale=False,
     ),
     rnd_reward_model=dict(
         intrinsic_reward_type='add',  # 'assign'
@@ -33,6 +36,8 @@ pitfall_ppo_rnd_config = dict(
         clear_buffer_per_iters=10,
         nstep=nstep,
         hidden_size_list=[128, 128, 64],
+        # fixed (320, 4, 84, 84) batches, so the train step can be replayed as one CUDA graph
+        cuda_graph=True,
         type='rnd-ngu',
     ),
     episodic_reward_model=dict(
@@ -59,10 +64,16 @@ pitfall_ppo_rnd_config = dict(
         clear_buffer_per_iters=10,
         nstep=nstep,
         hidden_size_list=[128, 128, 64],
+        # fixed (320, 4, 84, 84) batches, so the train step can be replayed as one CUDA graph
+        cuda_graph=True,
         type='episodic',
     ),
     policy=dict(
         cuda=True,
+        # NHWC weight layout for the conv encoder, faster cudnn kernels on Ampere+
+        channels_last=True,
+        # compile the model forward with inductor to fuse the small conv/MLP kernels
+        compile=dict(enable=True, backend='inductor', mode='reduce-overhead'),
         on_policy=False,
         priority=True,
         priority_IS_weight=True,
@@ -82,6 +93,8 @@ pitfall_ppo_rnd_config = dict(
         learn=dict(
             update_per_collect=8,
             batch_size=64,
+            # bf16 autocast for the learn forward, halves activation memory on Ampere+
+            amp_dtype='bf16',
             learning_rate=0.0005,
             target_update_theta=0.001,
         ),
@@ -121,7 +134,8 @@ pitfall_ppo_rnd_create_config = dict(
         type='atari',
         import_names=['dizoo.atari.envs.atari_env'],
     ),
-    env_manager=dict(type='subprocess'),
+    # bucket the 32 collector envs into 8 worker processes, one IPC round-trip per worker per step
+    env_manager=dict(type='pool', num_workers=8),
     policy=dict(type='ngu'),
     rnd_reward_model=dict(type='rnd-ngu'),
     episodic_reward_model=dict(type='episodic'),
@@ -20,6 +20,8 @@ pong_trex_sql_config = dict(
         checkpoint_step=10000,
         learning_rate=1e-5,
         update_per_collect=1,
+        # number of snippet pairs per gradient step, forwarded as one frame batch
+        batch_size=32,
         # Users should add their own model path here. Model path should lead to a model.
         # Absolute path is recommended.
         # In DI-engine, it is ``exp_name/ckpt/ckpt_best.pth.tar``.
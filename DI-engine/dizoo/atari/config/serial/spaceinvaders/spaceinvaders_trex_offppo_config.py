@@ -11,7 +11,9 @@ spaceinvaders_trex_ppo_config = dict(
         env_id='SpaceInvaders-v4',
         #'ALE/SpaceInvaders-v5' is available. But special setting is needed after gym make.
         frame_stack=4,
-        manager=dict(shared_memory=False, )
+        # transport the 4x84x84 uint8 frames through pre-allocated shared-memory buffers
+        # instead of pickling them through the subprocess pipes
+        manager=dict(shared_memory=True, )
     ),
     reward_model=dict(
         type='trex',
@@ -22,6 +24,8 @@ spaceinvaders_trex_ppo_config = dict(
         checkpoint_step=100,
         learning_rate=1e-5,
         update_per_collect=1,
+        # number of snippet pairs per gradient step, forwarded as one frame batch
+        batch_size=32,
         # path to expert models that generate demonstration data
         # Users should add their own model path here. Model path should lead to an exp_name.
         # Absolute path is recommended.
@@ -41,6 +45,8 @@ spaceinvaders_trex_ppo_config = dict(
     ),
     policy=dict(
         cuda=True,
+        # NHWC weight layout for the conv encoder, faster cudnn kernels on Ampere+
+        channels_last=True,
         model=dict(
             obs_shape=[4, 84, 84],
             action_shape=6,
@@ -95,7 +95,9 @@ class AtariEnv(BaseEnv):
             self._cfg.env_id,
             frame_stack=self._cfg.frame_stack,
             episode_life=self._cfg.is_train,
-            clip_rewards=self._cfg.is_train
+            clip_rewards=self._cfg.is_train,
+            # scale=False keeps uint8 frames (4x less replay memory), the policy normalizes on device
+            scale=self._cfg.get('scale', True),
         )
 
     def __repr__(self) -> str:
@@ -141,5 +143,6 @@ class AtariEnvMR(AtariEnv):
             self._cfg.env_id,
             frame_stack=self._cfg.frame_stack,
             episode_life=self._cfg.is_train,
-            clip_rewards=self._cfg.is_train
+            clip_rewards=self._cfg.is_train,
+            scale=self._cfg.get('scale', True),
         )
@@ -6,7 +6,9 @@ ant_td3_config = dict(
         env_id='Ant-v3',
         norm_obs=dict(use_norm=False, ),
         norm_reward=dict(use_norm=False, ),
-        collector_env_num=1,
+        # vectorized collection: stepping one env per SGD step leaves the GPU idle most of the
+        # time, so collect a batch of transitions per iteration and amortize the launch overhead
+        collector_env_num=32,
         evaluator_env_num=8,
         n_evaluator_episode=8,
         stop_value=6000,
@@ -14,6 +16,8 @@ ant_td3_config = dict(
     ),
     policy=dict(
         cuda=True,
+        # compile the model forward with inductor to fuse the small MLP kernels
+        compile=dict(enable=True, backend='inductor', mode='reduce-overhead'),
         random_collect_size=25000,
         model=dict(
             obs_shape=111,
@@ -24,8 +28,12 @@ ant_td3_config = dict(
             action_space='regression',
         ),
         learn=dict(
-            update_per_collect=1,
+            # 4 updates per collected transition (128 updates / 32 samples): with a 256-wide
+            # model one update per transition leaves the GPU mostly idle, aim for >70% util
+            update_per_collect=128,
             batch_size=256,
+            # bf16 autocast for the learn forward, halves activation memory on Ampere+
+            amp_dtype='bf16',
             learning_rate_actor=1e-3,
             learning_rate_critic=1e-3,
             ignore_done=False,
@@ -40,7 +48,7 @@ ant_td3_config = dict(
             ),
         ),
         collect=dict(
-            n_sample=1,
+            n_sample=32,
             unroll_len=1,
             noise_sigma=0.1,
         ),
@@ -56,7 +64,9 @@ ant_td3_create_config = dict(
         type='mujoco',
         import_names=['dizoo.mujoco.envs.mujoco_env'],
     ),
-    env_manager=dict(type='base'),
+    # async stepping: the collector forwards the ready envs while the stragglers keep
+    # running in their workers, so env simulation overlaps the learner updates
+    env_manager=dict(type='async_subprocess', wait_num=24, step_wait_timeout=0.01),
     policy=dict(
         type='td3',
         import_names=['ding.policy.td3'],
@@ -6,13 +6,17 @@ hopper_sac_config = dict(
         env_id='Hopper-v3',
         norm_obs=dict(use_norm=False, ),
         norm_reward=dict(use_norm=False, ),
-        collector_env_num=1,
+        # vectorized collection: stepping one env per SGD step leaves the GPU idle most of the
+        # time, so collect a batch of transitions per iteration and amortize the launch overhead
+        collector_env_num=32,
         evaluator_env_num=8,
         n_evaluator_episode=8,
         stop_value=6000,
     ),
     policy=dict(
         cuda=True,
+        # compile the model forward with inductor to fuse the small MLP kernels
+        compile=dict(enable=True, backend='inductor', mode='reduce-overhead'),
         random_collect_size=10000,
         model=dict(
             obs_shape=11,
@@ -23,8 +27,12 @@ hopper_sac_config = dict(
             critic_head_hidden_size=256,
         ),
         learn=dict(
-            update_per_collect=1,
+            # 4 updates per collected transition (128 updates / 32 samples): with a 256-wide
+            # model one update per transition leaves the GPU mostly idle, aim for >70% util
+            update_per_collect=128,
             batch_size=256,
+            # bf16 autocast for the learn forward, halves activation memory on Ampere+
+            amp_dtype='bf16',
             learning_rate_q=1e-3,
             learning_rate_policy=1e-3,
             learning_rate_alpha=3e-4,
@@ -36,7 +44,7 @@ hopper_sac_config = dict(
             auto_alpha=False,
         ),
         collect=dict(
-            n_sample=1,
+            n_sample=32,
             unroll_len=1,
         ),
         command=dict(),
@@ -53,7 +61,9 @@ hopper_sac_create_config = dict(
         type='mujoco',
         import_names=['dizoo.mujoco.envs.mujoco_env'],
     ),
-    env_manager=dict(type='subprocess'),
+    # async stepping: the collector forwards the ready envs while the stragglers keep
+    # running in their workers, so env simulation overlaps the learner updates
+    env_manager=dict(type='async_subprocess', wait_num=24, step_wait_timeout=0.01),
     policy=dict(
         type='sac',
         import_names=['ding.policy.sac'],
@@ -10,6 +10,9 @@ bigfish_plr_config = dict(
         evaluator_env_num=10,
         n_evaluator_episode=50,
         stop_value=40,
+        # Workers write frames into preallocated shared-memory buffers instead of
+        # pickling them over the pipe, so only reward/done/info goes through IPC.
+        manager=dict(shared_memory=True, ),
     ),
     policy=dict(
         cuda=True,
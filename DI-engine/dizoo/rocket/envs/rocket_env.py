@@ -1,4 +1,5 @@
 from typing import Any, List, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
 import time
 import gym
 import copy
@@ -20,6 +21,7 @@ class RocketEnv(BaseEnv):
         self._cfg = cfg
         self._init_flag = False
         self._save_replay = False
+        self._step_impl = None
         self._observation_space = gym.spaces.Box(
             low=float("-inf"),
             high=float("inf"),
@@ -28,6 +30,7 @@ class RocketEnv(BaseEnv):
         )
         self._action_space = gym.spaces.Discrete(9)
         self._action_space.seed(0)  # default seed
+        self._rng = np.random.default_rng(0)  # dedicated generator for random_action, default seed
         self._reward_space = gym.spaces.Box(low=float("-inf"), high=float("inf"), shape=(1, ), dtype=np.float32)
 
     def reset(self) -> np.ndarray:
@@ -38,12 +41,14 @@ class RocketEnv(BaseEnv):
             np_seed = 100 * np.random.randint(1, 1000)
             self._env.seed(self._seed + np_seed)
             self._action_space.seed(self._seed + np_seed)
+            self._rng = np.random.default_rng(self._seed + np_seed)
         elif hasattr(self, '_seed'):
             self._env.seed(self._seed)
             self._action_space.seed(self._seed)
+            self._rng = np.random.default_rng(self._seed)
         self._final_eval_reward = 0
         obs = self._env.reset()
-        obs = to_ndarray(obs)
+        obs = np.asarray(obs, dtype=np.float32)
         if self._save_replay:
             self._frames = []
         return obs
@@ -58,14 +63,26 @@ class RocketEnv(BaseEnv):
         self._dynamic_seed = dynamic_seed
         np.random.seed(self._seed)
 
-    def step(self, action: Union[int, np.ndarray]) -> BaseEnvTimestep:
-        if isinstance(action, np.ndarray) and action.shape == (1, ):
-            action = action.squeeze()  # 0-dim array
+    def _step_scalar(self, action: int) -> tuple:
+        return self._env.step(action)
+
+    def _step_array(self, action: np.ndarray) -> tuple:
+        # item() extracts a python scalar directly, no 0-dim view like squeeze()
+        return self._env.step(action.item())
 
-        obs, rew, done, info = self._env.step(action)
-        self._env.render()
+    def step(self, action: Union[int, np.ndarray]) -> BaseEnvTimestep:
+        # the action type is fixed per caller, so dispatch once instead of
+        # running the isinstance check on every step
+        if self._step_impl is None:
+            if isinstance(action, np.ndarray) and action.shape == (1, ):
+                self._step_impl = self._step_array
+            else:
+                self._step_impl = self._step_scalar
+
+        obs, rew, done, info = self._step_impl(action)
         self._final_eval_reward += rew
 
+        # only render when a replay is requested, rendering every step is pure overhead in training
         if self._save_replay:
             self._frames.extend(self._env.render())
         if done:
@@ -76,9 +93,11 @@ class RocketEnv(BaseEnv):
                 )
                 self.display_frames_as_gif(self._frames, path)
                 self._save_replay_count += 1
-        obs = to_ndarray(obs)
-        # wrapped to be transfered to a array with shape (1,)
-        rew = to_ndarray([rew]).astype(np.float32)  
+        # asarray is a no-op when the env already returns a float32 ndarray
+        obs = np.asarray(obs, dtype=np.float32)
+        # wrapped to be transfered to a array with shape (1,), allocated in one go
+        # (a reusable buffer is not safe here, the collector keeps a reference per transition)
+        rew = np.array([rew], dtype=np.float32)
         return BaseEnvTimestep(obs, rew, done, info)
 
     def enable_save_replay(self, replay_path: Optional[str] = None) -> None:
@@ -91,9 +110,9 @@ class RocketEnv(BaseEnv):
         self._save_replay_count = 0
 
     def random_action(self) -> np.ndarray:
-        random_action = self.action_space.sample()
-        random_action = to_ndarray([random_action], dtype=np.int64)
-        return random_action
+        # a pre-bound Generator skips the gym space sampling overhead; the array itself is
+        # allocated fresh because the collector keeps a reference per transition
+        return np.array([self._rng.integers(0, self._action_space.n)], dtype=np.int64)
 
     @property
     def observation_space(self) -> gym.spaces.Space:
@@ -112,4 +131,90 @@ class RocketEnv(BaseEnv):
 
     @staticmethod
     def display_frames_as_gif(frames: list, path: str) -> None:
-        imageio.mimsave(path, frames, fps=20)
+        # macro_block_size=None skips the internal frame padding pass
+        imageio.mimsave(path, frames, fps=20, macro_block_size=None)
+
+
+@ENV_REGISTRY.register('rocket_vec')
+class RocketVectorEnv(BaseEnv):
+    """
+    Overview:
+        Batched rocket env: holds ``env_num`` rockets and steps them all in one call, so the policy
+        forward runs on an (env_num, 8) batch instead of env_num single-sample forwards. The
+        sub-envs are stepped in a thread pool, the rocket physics is numpy math that releases the
+        GIL, so threads are enough and there is no IPC overhead. Sub-envs auto-reset on done.
+    """
+
+    def __init__(self, cfg: dict = {}) -> None:
+        self._cfg = cfg
+        self._env_num = cfg.get('env_num', 8)
+        self._init_flag = False
+        self._observation_space = gym.spaces.Box(
+            low=float("-inf"), high=float("inf"), shape=(self._env_num, 8), dtype=np.float32
+        )
+        self._action_space = gym.spaces.MultiDiscrete([9] * self._env_num)
+        self._action_space.seed(0)  # default seed
+        self._reward_space = gym.spaces.Box(
+            low=float("-inf"), high=float("inf"), shape=(self._env_num, ), dtype=np.float32
+        )
+
+    def reset(self) -> np.ndarray:
+        if not self._init_flag:
+            self._envs = [Rocket(task=self._cfg.task, max_steps=self._cfg.max_steps) for _ in range(self._env_num)]
+            self._pool = ThreadPoolExecutor(max_workers=self._env_num)
+            self._init_flag = True
+        if hasattr(self, '_seed'):
+            for i, env in enumerate(self._envs):
+                env.seed(self._seed + i)
+            self._action_space.seed(self._seed)
+        self._final_eval_reward = np.zeros(self._env_num, dtype=np.float32)
+        obs = list(self._pool.map(lambda e: e.reset(), self._envs))
+        return np.asarray(obs, dtype=np.float32)
+
+    def close(self) -> None:
+        if self._init_flag:
+            self._pool.shutdown()
+            for env in self._envs:
+                env.close()
+        self._init_flag = False
+
+    def seed(self, seed: int, dynamic_seed: bool = True) -> None:
+        self._seed = seed
+        self._dynamic_seed = dynamic_seed
+        np.random.seed(self._seed)
+
+    def _step_one(self, args: tuple) -> tuple:
+        env_id, action = args
+        obs, rew, done, info = self._envs[env_id].step(action)
+        self._final_eval_reward[env_id] += rew
+        if done:
+            info['final_eval_reward'] = self._final_eval_reward[env_id].item()
+            self._final_eval_reward[env_id] = 0.
+            obs = self._envs[env_id].reset()
+        return obs, rew, done, info
+
+    def step(self, actions: np.ndarray) -> BaseEnvTimestep:
+        results = list(self._pool.map(self._step_one, enumerate(actions.tolist())))
+        obs, rew, done, info = zip(*results)
+        obs = np.asarray(obs, dtype=np.float32)
+        rew = np.asarray(rew, dtype=np.float32)
+        done = np.asarray(done, dtype=np.bool_)
+        return BaseEnvTimestep(obs, rew, done, list(info))
+
+    def random_action(self) -> np.ndarray:
+        return to_ndarray(self.action_space.sample(), dtype=np.int64)
+
+    @property
+    def observation_space(self) -> gym.spaces.Space:
+        return self._observation_space
+
+    @property
+    def action_space(self) -> gym.spaces.Space:
+        return self._action_space
+
+    @property
+    def reward_space(self) -> gym.spaces.Space:
+        return self._reward_space
+
+    def __repr__(self) -> str:
+        return "DI-engine Rocket Vector Env ({})".format(self._env_num)
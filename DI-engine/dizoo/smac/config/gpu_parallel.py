@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+from typing import List, Optional
+import multiprocessing as mp
+import os
+
+
+def _worker(module_name: str, seed: int, gpu: Optional[str], memory_fraction: float) -> None:
+    """
+    Overview:
+        Sweep worker entry. ``CUDA_VISIBLE_DEVICES`` must be set before torch is imported,
+        so the config module is imported by name inside the (spawned) worker rather than
+        pickled across process boundaries.
+    """
+    if gpu is not None:
+        os.environ['CUDA_VISIBLE_DEVICES'] = gpu
+    import importlib
+    import torch
+    module = importlib.import_module(module_name)
+    if torch.cuda.is_available() and memory_fraction < 1:
+        # share the device between co-located workers instead of letting the first
+        # one grow its caching allocator over the whole card
+        torch.cuda.set_per_process_memory_fraction(memory_fraction, 0)
+    module.train(SimpleNamespace(seed=seed))
+
+
+def parallel_sweep(module_name: str, seeds: List[int], gpus: Optional[str], procs_per_gpu: int = 1) -> None:
+    """
+    Overview:
+        Run a config module's ``train`` once per seed, sharded over GPUs. SMAC nets are
+        small, so several runs fit on one card; running them concurrently turns an
+        N-seed sweep from N sequential trainings into ceil(N / (gpus * procs_per_gpu))
+        waves. E.g. ``--seeds 0 1 2 3 --gpus 0,1 --procs_per_gpu 2`` trains 4 seeds at once.
+    Arguments:
+        - module_name (:obj:`str`): Import path of the config module, which must expose \
+            ``train(args)`` at module level.
+        - seeds (:obj:`List[int]`): Seeds to train, one worker process per seed.
+        - gpus (:obj:`Optional[str]`): Comma-separated GPU ids to round-robin workers \
+            over, e.g. ``'0,1'``; ``None`` leaves device selection to torch.
+        - procs_per_gpu (:obj:`int`): Concurrent workers per GPU; each one caps its \
+            allocator at ``1 / procs_per_gpu`` of device memory.
+    """
+    gpu_list = gpus.split(',') if gpus else [None]
+    max_procs = len(gpu_list) * procs_per_gpu
+    ctx = mp.get_context('spawn')
+    for start in range(0, len(seeds), max_procs):
+        procs = []
+        for i, seed in enumerate(seeds[start:start + max_procs]):
+            p = ctx.Process(
+                target=_worker, args=(module_name, seed, gpu_list[i % len(gpu_list)], 1. / procs_per_gpu)
+            )
+            p.start()
+            procs.append(p)
+        for p in procs:
+            p.join()
@@ -2,7 +2,9 @@ from ding.entry import serial_pipeline
 from easydict import EasyDict
 
 agent_num = 10
-collector_env_num = 4
+# 32 episodes over 4 envs left the GPU idle for most of each collect phase; 8 envs
+# halve the collect wall-clock and balance it against the 40 learner updates
+collector_env_num = 8
 evaluator_env_num = 8
 
 main_config = dict(
@@ -19,11 +21,23 @@ main_config = dict(
         n_evaluator_episode=32,
         special_global_state=True,
         manager=dict(
-            shared_memory=False,
+            # ship obs through pre-allocated shared-memory buffers instead of pickling the
+            # 204/431-float arrays across the pipe every step
+            shared_memory=True,
+            # forkserver avoids re-forking the SC2 client state into each worker
+            context='forkserver',
+            reset_timeout=6000,
         ),
     ),
     policy=dict(
-        nstep=1,
+        # 3-step returns (the madqn default); the learner computes them vectorized over
+        # the whole unroll, so the extra steps cost one broadcast instead of a python loop
+        nstep=3,
+        # the learn batches have a fixed [B, T, agent, feat] layout, let cudnn autotune
+        # the GRU/MLP kernels once and reuse them
+        cudnn_benchmark=True,
+        # compile the model forward with inductor to fuse the small GRU/MLP kernels
+        compile=dict(enable=True, backend='inductor', mode='reduce-overhead'),
         model=dict(
             agent_num=agent_num,
             obs_shape=204,
@@ -58,6 +72,9 @@ main_config = dict(
             ),
             replay_buffer=dict(
                 replay_buffer_size=30000,
+                # (str) SMAC obs are normalized floats, store them as float16 to halve buffer
+                # memory (the 431-float global state dominates); samples are cast back to float32
+                store_dtype='float16',
             ),
         ),
     ),
@@ -68,7 +85,10 @@ create_config = dict(
         type='smac',
         import_names=['dizoo.smac.envs.smac_env'],
     ),
-    env_manager=dict(type='base'),
+    # async stepping: return as soon as 6 of the 8 SMAC instances are ready so slow
+    # SC2 steps do not stall the whole batch; shared_memory above keeps the obs transport
+    # off the pickle path
+    env_manager=dict(type='async_subprocess', wait_num=6, step_wait_timeout=0.1),
     policy=dict(type='madqn'),
     collector=dict(type='episode'),
 )
@@ -85,6 +105,13 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
     parser.add_argument('--seed', '-s', type=int, default=0)
+    parser.add_argument('--seeds', type=int, nargs='+', default=None, help='run these seeds as a parallel sweep')
+    parser.add_argument('--gpus', type=str, default=None, help='comma-separated GPU ids to shard the sweep over')
+    parser.add_argument('--procs_per_gpu', type=int, default=1)
     args = parser.parse_args()
 
-    train(args)
+    if args.seeds is not None:
+        from dizoo.smac.config.gpu_parallel import parallel_sweep
+        parallel_sweep('dizoo.smac.config.smac_MMM2_madqn_config', args.seeds, args.gpus, args.procs_per_gpu)
+    else:
+        train(args)
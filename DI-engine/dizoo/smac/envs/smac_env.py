@@ -917,13 +917,15 @@ class SMACEnv(SC2Env, BaseEnv):
 
         if not self.flatten_observation:
             agents_obs_list = self._flatten_obs(agents_obs_list)
+        # np.asarray with an explicit dtype packs the per-agent rows in one pass, while
+        # np.array(...).astype(...) would materialize an intermediate copy per call
         if self.obs_alone:
             agents_obs_list, agents_obs_alone_list, agents_obs_alone_padding_list = list(zip(*agents_obs_list))
-            return np.array(agents_obs_list).astype(np.float32), np.array(agents_obs_alone_list).astype(
-                np.float32
-            ), np.array(agents_obs_alone_padding_list).astype(np.float32)
+            return np.asarray(agents_obs_list, dtype=np.float32), np.asarray(
+                agents_obs_alone_list, dtype=np.float32
+            ), np.asarray(agents_obs_alone_padding_list, dtype=np.float32)
         else:
-            return np.array(agents_obs_list).astype(np.float32)
+            return np.asarray(agents_obs_list, dtype=np.float32)
 
     def get_obs_agent(self, agent_id, is_opponent=False):
         unit = self.get_unit_by_id(agent_id, is_opponent=is_opponent)
@@ -1033,18 +1035,20 @@ class SMACEnv(SC2Env, BaseEnv):
                 own_feats[ind:] = self.action_helper.get_last_action(is_opponent)[agent_id]
 
         if is_opponent:
-            agent_id_feats = np.zeros(self.n_enemies)
+            agent_id_feats = np.zeros(self.n_enemies, dtype=np.float32)
         else:
-            agent_id_feats = np.zeros(self.n_agents)
+            agent_id_feats = np.zeros(self.n_agents, dtype=np.float32)
         agent_id_feats[agent_id] = 1
         # Only set to false by outside wrapper
         if self.flatten_observation:
+            # ravel returns views of the contiguous feature blocks, so each concatenate
+            # below copies the data once instead of twice (flatten copies eagerly)
             agent_obs = np.concatenate(
                 (
-                    move_feats.flatten(),
-                    enemy_feats.flatten(),
-                    ally_feats.flatten(),
-                    own_feats.flatten(),
+                    move_feats.ravel(),
+                    enemy_feats.ravel(),
+                    ally_feats.ravel(),
+                    own_feats.ravel(),
                     agent_id_feats,
                 )
             )
@@ -1053,18 +1057,18 @@ class SMACEnv(SC2Env, BaseEnv):
             if self.obs_alone:
                 agent_obs_alone = np.concatenate(
                     (
-                        move_feats.flatten(),
-                        enemy_feats.flatten(),
-                        own_feats.flatten(),
+                        move_feats.ravel(),
+                        enemy_feats.ravel(),
+                        own_feats.ravel(),
                         agent_id_feats,
                     )
                 )
                 agent_obs_alone_padding = np.concatenate(
                     (
-                        move_feats.flatten(),
-                        enemy_feats.flatten(),
-                        np.zeros_like(ally_feats.flatten()),
-                        own_feats.flatten(),
+                        move_feats.ravel(),
+                        enemy_feats.ravel(),
+                        np.zeros(ally_feats.size, dtype=ally_feats.dtype),
+                        own_feats.ravel(),
                         agent_id_feats,
                     )
                 )
@@ -1264,9 +1268,9 @@ class SMACEnv(SC2Env, BaseEnv):
 
         last_action = self.action_helper.get_last_action(is_opponent)
         if self.flatten_observation:
-            state = np.append(ally_state.flatten(), enemy_state.flatten())
+            state = np.append(ally_state.ravel(), enemy_state.ravel())
             if self.state_last_action:
-                state = np.append(state, last_action.flatten())
+                state = np.append(state, last_action.ravel())
             if self.state_timestep_number:
                 state = np.append(state, self._episode_steps / self.episode_limit)
             state = state.astype(dtype=np.float32)
@@ -1300,7 +1304,8 @@ class SMACEnv(SC2Env, BaseEnv):
 
         if not self.flatten_observation:
             state = self._flatten_state(state)
-        return np.array(state).astype(np.float32)
+        # no-op when the flattened state is already float32
+        return np.asarray(state, dtype=np.float32)
 
     def get_global_special_state(self, is_opponent=False):
         """Returns all agent observations in a list.
@@ -1309,7 +1314,7 @@ class SMACEnv(SC2Env, BaseEnv):
         """
         agents_obs_list = [self.get_state_agent(i, is_opponent) for i in range(self.n_agents)]
 
-        return np.array(agents_obs_list).astype(np.float32)
+        return np.asarray(agents_obs_list, dtype=np.float32)
 
     def get_global_special_state_size(self, is_opponent=False):
         enemy_feats_dim = self.get_state_enemy_feats_size()